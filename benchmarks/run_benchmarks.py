@@ -0,0 +1,282 @@
+"""
+Suíte de benchmarks do gerador.
+
+Mede a compilação de cada template, a renderização de cada template, a
+geração completa de uma entidade e modelos sintéticos de 10/100/1000
+entidades com muitos relacionamentos. Os resultados são gravados em JSON
+para acompanhar regressões entre versões (--compare mostra a variação
+em relação a um resultado anterior).
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/run_benchmarks.py [--runs 5] [--sizes 10,100,1000]
+        [--output benchmarks/results/atual.json] [--compare anterior.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import jinja2
+from config import PACKAGE_BASE
+from main import TEMPLATES, create_environment, generate_model, render_entity
+from schema import build_context, load_model, parse_field, parse_relationship
+from sinks import MemorySink
+
+RESULTS_VERSION = 1
+
+# Relationships per synthetic entity: ManyToOne parents plus their OneToMany
+# back-references and a ManyToMany chain, all valid for ModelIndex
+SYNTHETIC_PARENTS = 3
+
+
+def basic_context():
+    fields = [
+        parse_field(entry)
+        for entry in (
+            "nome:String:100",
+            "email:String:255",
+            "idade:Integer::positive",
+            "saldo:BigDecimal::positive",
+            "ativo:Boolean",
+            "nascimento:LocalDate",
+        )
+    ]
+    return build_context("Cliente", "TB_CLIENTE", fields, [], PACKAGE_BASE)
+
+
+def relationship_context():
+    context = basic_context()
+    context["entity_name"] = "Pedido"
+    context["table_name"] = "TB_PEDIDO"
+    context["relationships"] = [
+        parse_relationship(entry)
+        for entry in (
+            "cliente:ManyToOne:Cliente:::not_null",
+            "itens:OneToMany:ItemPedido:pedido:cascade",
+            "endereco:OneToOne:Endereco:::cascade,owner",
+            "categorias:ManyToMany:Categoria::inverse_field=Pedidos",
+        )
+    ]
+    return context
+
+
+def synthetic_model(size, parents=SYNTHETIC_PARENTS):
+    """Modelo válido com size entidades encadeadas por relacionamentos"""
+    names = [f"Entidade{i:04d}" for i in range(size)]
+    entities = []
+    for i, name in enumerate(names):
+        relationships = []
+        for k in range(1, parents + 1):
+            if i - k >= 0:
+                relationships.append(f"pai{k}:ManyToOne:{names[i - k]}")
+            if i + k < size:
+                relationships.append(f"filhos{k}:OneToMany:{names[i + k]}:pai{k}")
+        if i > 0:
+            relationships.append(
+                f"anteriores:ManyToMany:{names[i - 1]}::inverse_field=proximos"
+            )
+        if i + 1 < size:
+            relationships.append(
+                f"proximos:ManyToMany:{names[i + 1]}::inverse_field=anteriores"
+            )
+        entities.append(
+            {
+                "name": name,
+                "fields": [
+                    "nome:String:100",
+                    "descricao:String:500",
+                    "valor:BigDecimal::positive",
+                    "quantidade:Integer::positive",
+                    "ativo:Boolean",
+                ],
+                "relationships": relationships,
+            }
+        )
+    return {"entities": entities}
+
+
+def measure(function, runs):
+    """Executa function runs vezes e devolve as durações em segundos"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples, **extra):
+    result = {
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+        "runs": len(samples),
+    }
+    result.update(extra)
+    return result
+
+
+def bench_compile(runs):
+    """Compilação de cada template, sem cache em memória nem em disco"""
+    results = {}
+    for template_name, _ in TEMPLATES:
+
+        def compile_template():
+            create_environment(cache_dir=None).get_template(template_name)
+
+        results[f"compile/{template_name}"] = summarize(measure(compile_template, runs))
+    return results
+
+
+def bench_render(runs):
+    """Renderização de cada template (já compilado) com e sem relacionamentos"""
+    env = create_environment(cache_dir=None)
+    results = {}
+    for label, context in (
+        ("basic", basic_context()),
+        ("relationships", relationship_context()),
+    ):
+        for template_name, _ in TEMPLATES:
+            template = env.get_template(template_name)
+            results[f"render/{label}/{template_name}"] = summarize(
+                measure(lambda: template.render(context), runs * 20)
+            )
+    return results
+
+
+def bench_entity(runs):
+    """Todos os artefatos de uma entidade, em memória"""
+    context = relationship_context()
+    return {
+        "entity/render_entity": summarize(
+            measure(lambda: render_entity(context), runs * 5)
+        )
+    }
+
+
+def bench_models(runs, sizes, workers):
+    """Carga/validação e geração completa de modelos sintéticos"""
+    results = {}
+    for size in sizes:
+        model = synthetic_model(size)
+        relationships = sum(len(e["relationships"]) for e in model["entities"])
+        model_runs = max(1, runs if size <= 100 else runs // 5)
+
+        results[f"model/{size}/load"] = summarize(
+            measure(lambda: load_model(model, PACKAGE_BASE), model_runs),
+            entities=size,
+            relationships=relationships,
+        )
+
+        contexts = load_model(model, PACKAGE_BASE)
+
+        def generate():
+            report = generate_model(contexts, workers=workers, sink=MemorySink())
+            if report.errors:
+                raise RuntimeError(report.errors[0])
+
+        results[f"model/{size}/generate"] = summarize(
+            measure(generate, model_runs),
+            entities=size,
+            relationships=relationships,
+            files=size * len(TEMPLATES),
+            workers=workers,
+        )
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(runs, sizes, workers):
+    results = {}
+    results.update(bench_compile(runs))
+    results.update(bench_render(runs))
+    results.update(bench_entity(runs))
+    # generate_model prints one line per file; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        results.update(bench_models(runs, sizes, workers))
+
+    return {
+        "version": RESULTS_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "jinja2": jinja2.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "results": results,
+    }
+
+
+def print_table(data, baseline=None):
+    previous = (baseline or {}).get("results", {})
+    print(f"{'benchmark':58} {'mediana (ms)':>13} {'mín (ms)':>10}", end="")
+    print(f" {'vs anterior':>12}" if baseline else "")
+    for name, result in data["results"].items():
+        line = f"{name:58} {result['median_ms']:13.3f} {result['min_ms']:10.3f}"
+        if name in previous:
+            change = result["median_ms"] / previous[name]["median_ms"] - 1
+            line += f" {change:+11.1%}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--sizes",
+        default="10,100,1000",
+        help="Tamanhos dos modelos sintéticos (padrão: 10,100,1000)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processos usados na geração dos modelos (padrão: 1)",
+    )
+    parser.add_argument("--output", help="Grava os resultados neste arquivo JSON")
+    parser.add_argument("--compare", help="Resultado JSON anterior para comparação")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    data = run(args.runs, sizes, args.workers)
+    print_table(data, baseline)
+
+    if args.output:
+        directory = os.path.dirname(os.path.abspath(args.output))
+        os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print(f"\nResultados gravados em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Mede o tempo de inicialização do gerador com o cache de templates
+compilados frio (sem cache em disco) e quente (cache já populado).
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/template_cache.py [--runs 10]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executed in a fresh interpreter so every run pays the real startup cost
+STARTUP_SNIPPET = """
+import sys, time
+import config
+config.TEMPLATE_CACHE_DIR = sys.argv[1]
+import main
+start = time.perf_counter()
+for template_name, _ in main.TEMPLATES:
+    main.env.get_template(template_name)
+print(time.perf_counter() - start)
+"""
+
+
+def run_startup(cache_dir):
+    """Executa uma inicialização e devolve (tempo de carga dos templates, tempo total do processo)"""
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", STARTUP_SNIPPET, cache_dir],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip()), time.perf_counter() - start
+
+
+def measure(runs):
+    cache_dir = tempfile.mkdtemp(prefix="ggv-jinja-cache-")
+    cold, warm = [], []
+    try:
+        for _ in range(runs):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold.append(run_startup(cache_dir))
+        for _ in range(runs):
+            warm.append(run_startup(cache_dir))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return cold, warm
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    cold, warm = measure(args.runs)
+
+    def median_ms(samples, index):
+        return statistics.median(sample[index] for sample in samples) * 1000
+
+    print(f"Inicialização ({args.runs} execuções, mediana)")
+    print(f"{'':8} {'templates (ms)':>15} {'processo (ms)':>15}")
+    print(f"{'frio':8} {median_ms(cold, 0):15.1f} {median_ms(cold, 1):15.1f}")
+    print(f"{'quente':8} {median_ms(warm, 0):15.1f} {median_ms(warm, 1):15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,31 @@
 PACKAGE_BASE = "com.erp"
 OUTPUT_DIR = "output"
 TEMPLATE_DIR = "templates"
+TEMPLATE_CACHE_DIR = ".jinja_cache"  # None desativa o cache de templates compilados
+JDBC_BATCH_SIZE = 50  # hibernate.jdbc.batch_size do application.properties gerado
+ASYNC_POOL_SIZE = 50  # threads do executor do AsyncConfig (não passe do pool do Hikari)
+ASYNC_QUEUE_CAPACITY = 1000  # tarefas em espera antes de responder 503
+ASYNC_TIMEOUT_SECONDS = 30  # spring.mvc.async.request-timeout
+
+# Opções por entidade (chave "options" no arquivo de modelo). Os templates
+# usam estes mesmos valores quando o contexto não traz "options".
+ENTITY_OPTIONS = {
+    "pagination": "offset",  # offset | keyset (cursor no ID) | unbounded (List)
+    "page_size": 20,  # tamanho padrão da página
+    "max_page_size": 100,  # limite imposto pelo servidor ao parâmetro size
+    "fetch_batch_size": 100,  # @BatchSize das coleções (uma query a cada N donos)
+    "bulk": False,  # POST/PUT/DELETE /bulk com resultado por item
+    "bulk_chunk_size": 500,  # entidades por saveAll/flush/clear nas operações em lote
+    "id_strategy": "identity",  # identity | sequence (pooled, permite JDBC batching)
+    "id_allocation_size": 50,  # IDs reservados por ida ao banco com id_strategy sequence
+    "cache": False,  # @Cacheable no service + cache de segundo nível do Hibernate
+    "cache_max_size": 1000,  # entradas por cache (Caffeine)
+    "cache_ttl_seconds": 600,  # expiração após a escrita
+    "export": False,  # GET /export em NDJSON/CSV via streaming
+    "export_fetch_size": 1000,  # linhas por ida ao banco e por limpeza do contexto na exportação
+    "projections": False,  # leituras via interfaces de projeção (só colunas do Response)
+    "patch": False,  # PATCH /{id} só com os campos enviados (@DynamicUpdate)
+    "versioned": False,  # @Version (optimistic locking) + ETag/If-None-Match/If-Match
+    "migration": "none",  # none | flyway (db/migration/V<n>__create_<tabela>.sql)
+    "async": "none",  # none | virtual_threads | completable_future (ver AsyncConfig)
+}
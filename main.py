@@ -1,16 +1,93 @@
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+import argparse
+import contextlib
 import os
-from config import PACKAGE_BASE, OUTPUT_DIR, TEMPLATE_DIR
-
-env = Environment(
-    loader=FileSystemLoader(TEMPLATE_DIR), trim_blocks=True, lstrip_blocks=True
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from config import (
+    ASYNC_POOL_SIZE,
+    ASYNC_QUEUE_CAPACITY,
+    ASYNC_TIMEOUT_SECONDS,
+    JDBC_BATCH_SIZE,
+    OUTPUT_DIR,
+    PACKAGE_BASE,
+    TEMPLATE_CACHE_DIR,
+    TEMPLATE_DIR,
+)
+from manifest import Manifest, hash_context
+from profiling import Profiler, measure
+from sinks import ARCHIVE_FORMATS, DirectorySink, StdoutSink, open_archive
+from writer import remove_output, write_if_changed
+from schema import (
+    build_context,
+    load_model,
+    parse_field,
+    parse_relationship,
 )
 
 
+def create_environment(cache_dir=TEMPLATE_CACHE_DIR):
+    """
+    Cria o Environment Jinja2 dos templates.
+
+    Com cache_dir definido, o código compilado de cada template é
+    persistido em disco (FileSystemBytecodeCache) e reaproveitado nas
+    próximas execuções. Cada entrada guarda o checksum do fonte do
+    template, então qualquer alteração em templates/*.j2 invalida
+    apenas o template alterado.
+    """
+    bytecode_cache = None
+    if cache_dir:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(cache_dir)
+        except OSError:
+            # Read-only checkout: fall back to compiling in memory
+            bytecode_cache = None
+
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+env = create_environment()
+
+# Templates gerados por entidade: (template, nome do arquivo de saída)
+TEMPLATES = [
+    ("entity.java.j2", "{entity_name}.java"),
+    ("repository.java.j2", "{entity_name}Repository.java"),
+    ("request.java.j2", "{entity_name}Request.java"),
+    ("response.java.j2", "{entity_name}Response.java"),
+    ("mapper.java.j2", "{entity_name}Mapper.java"),
+    ("service.java.j2", "{entity_name}Service.java"),
+    ("controller.java.j2", "{entity_name}Controller.java"),
+    ("service_test.java.j2", "{entity_name}ServiceTest.java"),
+    ("controller_test.java.j2", "{entity_name}ControllerTest.java"),
+]
+
+# Artefatos únicos do modelo inteiro, na raiz da saída, com o recurso das
+# entidades que os exige (ver model_features)
+MODEL_TEMPLATES = [
+    ("application.properties.j2", "application.properties", "settings"),
+    ("application.conf.j2", "application.conf", "cache"),
+    ("async_config.java.j2", "AsyncConfig.java", "async"),
+]
+
+# Migration por entidade (opção migration), na raiz da saída
+MIGRATION_TEMPLATE = "migration.sql.j2"
+MIGRATION_DIR = "db/migration"
+MIGRATION_NAME = MIGRATION_DIR + "/V{version}__create_{table}.sql"
+
+
 def prompt_fields():
     """
     Prompt para coleta de campos da entidade.
-    Formato: nome:tipo[:length][:positive]
+    Formato: nome:tipo[:length][:positive,searchable,index[=grupo]]
 
     Tipos suportados: String, Integer, Long, Double, Float, Boolean, LocalDateTime, LocalDate, BigDecimal
 
@@ -25,6 +102,8 @@ def prompt_fields():
     print("Formatos aceitos:")
     print("  nome:String:100")
     print("  idade:Integer::positive")
+    print("  email:String:255:searchable")
+    print("  status:String:20:index=situacao")
     print("  preco:BigDecimal::positive")
     print("  percentual:Double::positive")
     print("  ativo:Boolean")
@@ -33,55 +112,19 @@ def prompt_fields():
 
     while True:
         entry = input(
-            "Campo (nome:tipo[:length][:positive]) ou ENTER para terminar: "
+            "Campo (nome:tipo[:length][:flags]) ou ENTER para terminar: "
         ).strip()
         if entry == "":
             break
 
-        parts = entry.split(":")
-        if len(parts) < 2:
-            print("❌ Erro: você precisa digitar pelo menos nome e tipo")
-            print("   Exemplo: nome:String")
-            continue
-
-        field_name = parts[0].strip()
-        field_type = parts[1].strip()
-
-        # Validate field type
-        valid_types = [
-            "String",
-            "Integer",
-            "Long",
-            "Double",
-            "Float",
-            "Boolean",
-            "LocalDateTime",
-            "LocalDate",
-            "UUID",
-            "BigDecimal",
-        ]
-        if field_type not in valid_types:
-            print(
-                f"❌ Erro: tipo '{field_type}' não suportado. Use: {', '.join(valid_types)}"
-            )
+        try:
+            field = parse_field(entry)
+        except ValueError as e:
+            print(f"❌ Erro: {e}")
             continue
 
-        field = {
-            "name": field_name,
-            "type": field_type,
-            "length": (
-                int(parts[2]) if len(parts) > 2 and parts[2].strip().isdigit() else None
-            ),
-            "not_null": True,
-            "positive": (
-                True
-                if len(parts) > 3 and parts[3].strip().lower() == "positive"
-                else False
-            ),
-        }
-
         fields.append(field)
-        print(f"✅ Adicionado: {field_name} ({field_type})")
+        print(f"✅ Adicionado: {field['name']} ({field['type']})")
 
     return fields
 
@@ -117,64 +160,568 @@ def prompt_relationships():
         if entry == "":
             break
 
-        parts = entry.split(":")
-        if len(parts) < 3:
-            print("❌ Erro: formato mínimo é nome:tipo:target")
-            print("   Exemplo: pedidos:OneToMany:Pedido")
+        try:
+            relationship = parse_relationship(entry)
+        except ValueError as e:
+            print(f"❌ Erro: {e}")
             continue
 
-        rel_name = parts[0].strip()
-        rel_type = parts[1].strip()
-        rel_target = parts[2].strip()
+        relationships.append(relationship)
+        print(
+            f"✅ Adicionado: {relationship['name']} ({relationship['type']} -> {relationship['target']})"
+        )
 
-        # Validate relationship type
-        valid_types = ["OneToMany", "ManyToOne", "OneToOne", "ManyToMany"]
-        if rel_type not in valid_types:
-            print(
-                f"❌ Erro: tipo '{rel_type}' não suportado. Use: {', '.join(valid_types)}"
-            )
-            continue
+    return relationships
+
+
+def write_output(output_path, content):
+    """Grava o arquivo gerado (atomicamente, só se mudou); devolve True se escreveu"""
+    written = write_if_changed(output_path, content)
+    if written:
+        print(f"Gerado: {output_path}")
+    return written
+
+
+def render_template(template_name, context, output_path, profiler=None):
+    with measure(profiler, "compile"):
+        template = env.get_template(template_name)
+    with measure(profiler, "render"):
+        content = template.render(context)
+    with measure(profiler, "write"):
+        write_output(output_path, content)
+
+
+def artifact_names(entity_name):
+    """Lista (template, nome relativo) de todos os artefatos de uma entidade"""
+    return [
+        (template_name, f"{entity_name}/{file_name.format(entity_name=entity_name)}")
+        for template_name, file_name in TEMPLATES
+    ]
+
+
+def artifact_paths(entity_name, output_dir=None):
+    """Lista (template, caminho de saída) de todos os arquivos de uma entidade"""
+    output_dir = OUTPUT_DIR if output_dir is None else output_dir
+    return [
+        (template_name, f"{output_dir}/{name}")
+        for template_name, name in artifact_names(entity_name)
+    ]
+
+
+def uses_jdbc_batching(context):
+    """Entidades cujas escritas em lote dependem do JDBC batching do Hibernate"""
+    options = context.get("options") or {}
+    return options.get("id_strategy") == "sequence" or bool(options.get("bulk"))
+
+
+def uses_cache(context):
+    """Entidades com cache de respostas e de segundo nível"""
+    options = context.get("options") or {}
+    return bool(options.get("cache"))
 
-        # Parse mapped_by
-        mapped_by = parts[3].strip() if len(parts) > 3 and parts[3].strip() else None
-
-        # Parse options
-        options = {}
-        if len(parts) > 4 and parts[4].strip():
-            option_parts = [opt.strip() for opt in parts[4].split(",")]
-            for opt in option_parts:
-                if "=" in opt:
-                    key, value = opt.split("=", 1)
-                    options[key.strip()] = value.strip()
-                else:
-                    options[opt] = True
-
-        relationship = {
-            "name": rel_name,
-            "type": rel_type,
-            "target": rel_target,
-            "mapped_by": mapped_by,
-            "cascade": options.get("cascade", False),
-            "not_null": options.get("not_null", False),
-            "owner": options.get("owner", False),
-            "inverse_field": options.get("inverse_field", None),
+
+def async_mode(context):
+    """Modo de execução dos endpoints da entidade (opção async)"""
+    options = context.get("options") or {}
+    return options.get("async", "none")
+
+
+def model_features(contexts):
+    """Recursos das entidades que exigem artefatos do modelo"""
+    features = set()
+    for context in contexts:
+        if uses_jdbc_batching(context):
+            features.add("settings")
+        if uses_cache(context):
+            features.update(("settings", "cache"))
+        if async_mode(context) == "virtual_threads":
+            features.add("settings")
+        elif async_mode(context) == "completable_future":
+            features.update(("settings", "async"))
+    return features
+
+
+def model_artifacts(contexts):
+    """
+    Lista (template, contexto, nome relativo) dos artefatos do modelo.
+
+    As configurações compartilhadas (application.properties) só são
+    geradas quando alguma entidade aproveita o JDBC batching, o cache ou
+    a opção async; a configuração dos caches (application.conf), só com
+    cache; o executor dos endpoints (AsyncConfig.java), só com async
+    completable_future; as migrations, só para as entidades com a opção
+    migration.
+    """
+    artifacts = []
+    features = model_features(contexts)
+    if features:
+        model_context = {
+            "package_base": contexts[0]["package_base"],
+            "entities": contexts,
+            "jdbc_batch_size": JDBC_BATCH_SIZE,
+            "async_pool_size": ASYNC_POOL_SIZE,
+            "async_queue_capacity": ASYNC_QUEUE_CAPACITY,
+            "async_timeout_seconds": ASYNC_TIMEOUT_SECONDS,
         }
+        artifacts = [
+            (template_name, model_context, name)
+            for template_name, name, feature in MODEL_TEMPLATES
+            if feature in features
+        ]
+    return artifacts + migration_artifacts(contexts)
 
-        relationships.append(relationship)
-        print(f"✅ Adicionado: {rel_name} ({rel_type} -> {rel_target})")
 
-    return relationships
+def uses_migration(context):
+    """Entidades com migration Flyway gerada"""
+    options = context.get("options") or {}
+    return options.get("migration", "none") != "none"
 
 
-def render_template(template_name, context, output_path):
-    template = env.get_template(template_name)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(template.render(context))
-    print(f"Gerado: {output_path}")
+def foreign_keys(context):
+    """
+    Lista (tabela, coluna, entidade alvo) das chaves estrangeiras que o
+    mapeamento da entidade cria: colunas *ToOne e as duas colunas de cada
+    tabela de junção ManyToMany.
+    """
+    table = context["table_name"].upper()
+    keys = []
+    for rel in context["relationships"]:
+        column = f"{rel['target'].upper()}_ID"
+        if rel["type"] in ("ManyToOne", "OneToOne"):
+            keys.append((table, f"{rel['name'].upper()}_ID", rel["target"]))
+        elif rel["type"] == "ManyToMany":
+            join_table = f"{table}_{rel['name'].upper()}"
+            owner_column = f"{context['entity_name'].upper()}_ID"
+            keys.append((join_table, owner_column, context["entity_name"]))
+            keys.append((join_table, column, rel["target"]))
+    return keys
+
+
+def migration_artifacts(contexts):
+    """
+    Lista (template, contexto, nome relativo) das migrations do modelo.
+
+    A versão de cada migration é a posição da entidade no modelo, então
+    entidades novas entram no final sem renumerar as já aplicadas. São
+    scripts de baseline (CREATE TABLE): generate_model não reescreve nem
+    apaga uma migration já registrada no manifest. Cada chave estrangeira
+    fica na migration da última das duas tabelas, a primeira em que ambas
+    existem; sem migration do outro lado, ela fica a cargo de quem cria a
+    outra tabela.
+    """
+    positions = {
+        context["entity_name"]: position
+        for position, context in enumerate(contexts, start=1)
+    }
+    migrating = {
+        context["entity_name"]: context
+        for context in contexts
+        if uses_migration(context)
+    }
+    if not migrating:
+        return []
+
+    constraints = {entity_name: [] for entity_name in migrating}
+    for entity_name, context in migrating.items():
+        for table, column, target in foreign_keys(context):
+            if target not in migrating:
+                continue
+            owner = max(entity_name, target, key=positions.get)
+            constraints[owner].append(
+                {
+                    "name": f"FK_{table}_{column}",
+                    "table": table,
+                    "column": column,
+                    "target_table": migrating[target]["table_name"].upper(),
+                }
+            )
+
+    return [
+        (
+            MIGRATION_TEMPLATE,
+            {
+                "package_base": context["package_base"],
+                "entity": context,
+                "version": positions[entity_name],
+                "foreign_keys": constraints[entity_name],
+            },
+            MIGRATION_NAME.format(
+                version=positions[entity_name], table=context["table_name"].lower()
+            ),
+        )
+        for entity_name, context in migrating.items()
+    ]
+
+
+def render_entity(context):
+    """
+    Renderiza todos os artefatos de uma entidade em memória, sem gravar
+    nada em disco. Devolve um dicionário nome relativo -> código fonte
+    (ex: "Cliente/ClienteService.java"), na ordem de TEMPLATES.
+    """
+    return {
+        name: env.get_template(template_name).render(context)
+        for template_name, name in artifact_names(context["entity_name"])
+    }
+
+
+def _render_job(job):
+    """
+    Executa um job (template, contexto, nome) no worker; nunca lança exceção.
+    Devolve (nome, conteúdo, erro, (segundos de compile, segundos de render)).
+    """
+    template_name, context, name = job
+    start = time.perf_counter()
+    try:
+        template = env.get_template(template_name)
+        loaded = time.perf_counter()
+        content = template.render(context)
+    except Exception as e:
+        return name, None, f"{type(e).__name__}: {e}", (0.0, 0.0)
+    return name, content, None, (loaded - start, time.perf_counter() - loaded)
+
+
+def _iter_results(jobs, workers):
+    """
+    Resultados dos jobs, na ordem dos jobs.
+
+    Com mais de um worker, no máximo workers * 2 jobs ficam em andamento
+    ou aguardando consumo: o código renderizado é liberado assim que o
+    sink o recebe, então a memória não cresce com o tamanho do modelo.
+    """
+    if workers <= 1:
+        yield from map(_render_job, jobs)
+        return
+
+    window = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for job in jobs:
+            pending.append(pool.submit(_render_job, job))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class GenerationReport:
+    """
+    Resultado de uma geração.
+
+    generated: arquivos renderizados com sucesso (written + unchanged)
+    written: arquivos gravados em disco
+    unchanged: renderizados, mas idênticos ao que já estava em disco
+    skipped: não renderizados porque o manifest indicou que nada mudou
+    removed: arquivos de entidades/templates que saíram do modelo
+    errors: (caminho, mensagem) de cada falha
+    """
+
+    def __init__(self):
+        self.generated = []
+        self.written = []
+        self.unchanged = []
+        self.skipped = []
+        self.removed = []
+        self.errors = []
+
+    def summary(self):
+        return (
+            f"✍️  {len(self.written)} escritos | "
+            f"✓ {len(self.unchanged) + len(self.skipped)} inalterados | "
+            f"🗑️  {len(self.removed)} removidos"
+        )
+
+
+def generate_model(
+    contexts, output_dir=None, workers=None, manifest=None, sink=None, profiler=None
+):
+    """
+    Gera todos os arquivos de todas as entidades do modelo, sem prompts.
+
+    Os jobs entidade×template são distribuídos em um pool de processos
+    (workers=None usa o número de CPUs; workers=1 renderiza no próprio
+    processo). A escrita acontece no processo principal, na ordem do
+    modelo, para que a saída seja determinística; só uma janela limitada
+    de resultados fica em memória por vez.
+
+    Os artefatos vão para o sink informado (padrão: DirectorySink em
+    output_dir). Com um Manifest (apenas para saída em diretório),
+    arquivos cujas entradas (contexto da entidade e template) não mudaram
+    desde a última geração não são renderizados nem reescritos, e o
+    manifest é atualizado ao final.
 
+    Com um Profiler, os tempos de cada fase e de cada template (medidos
+    nos workers) são acumulados nele.
 
-def main():
+    Devolve um GenerationReport; erros são (caminho, mensagem) com todas
+    as falhas da execução.
+    """
+    if sink is None:
+        sink = DirectorySink(OUTPUT_DIR if output_dir is None else output_dir)
+
+    report = GenerationReport()
+    artifacts = [
+        (template_name, context, name)
+        for context in contexts
+        for template_name, name in artifact_names(context["entity_name"])
+    ] + model_artifacts(contexts)
+
+    jobs = artifacts
+    input_hashes = {}
+    if manifest is not None:
+        jobs = []
+        context_hashes = {}
+        with measure(profiler, "manifest"):
+            for template_name, context, name in artifacts:
+                if id(context) not in context_hashes:
+                    context_hashes[id(context)] = hash_context(context)
+                output_path = sink.location(name)
+                input_hash = manifest.input_hash(
+                    context, context_hashes[id(context)], template_name
+                )
+                if manifest.is_current(output_path, input_hash):
+                    manifest.keep(output_path)
+                    report.skipped.append(output_path)
+                    continue
+                input_hashes[output_path] = input_hash
+                jobs.append((template_name, context, name))
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+
+    results = _iter_results(jobs, workers)
+    for job, (name, content, error, timings) in zip(jobs, results):
+        output_path = sink.location(name)
+        if profiler is not None:
+            profiler.record_template(job[0], *timings)
+        if (
+            error is None
+            and job[0] == MIGRATION_TEMPLATE
+            and manifest is not None
+            and manifest.is_locked(output_path, content)
+        ):
+            # Flyway may have applied it already: a new checksum would fail validation
+            manifest.keep(output_path)
+            error = (
+                "migration já gerada com outro conteúdo; escreva uma migration nova "
+                "com o ALTER (ou use --force se ela ainda não foi aplicada)"
+            )
+        if error is None:
+            try:
+                with measure(profiler, "write"):
+                    written = sink.write(name, content)
+            except OSError as e:
+                error = f"{type(e).__name__}: {e}"
+        if error is not None:
+            report.errors.append((output_path, error))
+            continue
+        if written:
+            print(f"Gerado: {output_path}")
+        report.generated.append(output_path)
+        (report.written if written else report.unchanged).append(output_path)
+        if manifest is not None:
+            manifest.record(output_path, input_hashes[output_path], content)
+
+    if manifest is not None:
+        with measure(profiler, "manifest"):
+            current_paths = report.skipped + [sink.location(job[2]) for job in jobs]
+            migration_dir = os.path.normpath(sink.location(MIGRATION_DIR))
+            for stale_path in manifest.stale_paths(current_paths):
+                if os.path.normpath(stale_path).startswith(migration_dir + os.sep):
+                    # Never delete a migration Flyway may have applied
+                    manifest.keep(stale_path)
+                    print(f"Mantido: {stale_path} (migration fora do modelo)")
+                    continue
+                if remove_output(stale_path):
+                    print(f"Removido: {stale_path}")
+                    report.removed.append(stale_path)
+            manifest.save()
+
+    return report
+
+
+def print_errors(errors):
+    print(f"\n❌ {len(errors)} arquivo(s) com erro:")
+    for output_path, message in errors:
+        print(f"   - {output_path}: {message}")
+
+
+def generate_from_schema(
+    schema_path, output_dir=None, workers=None, force=False, sink=None, profiler=None
+):
+    """
+    Modo batch: lê o modelo (JSON/YAML) e gera todas as entidades.
+
+    Em diretório, a geração é incremental: só são renderizados os
+    arquivos cujas entradas mudaram desde a última execução (force=True
+    gera tudo). Com outro sink, todos os artefatos são enviados a ele.
+    """
+    try:
+        with measure(profiler, "parse"):
+            contexts = load_model(schema_path, PACKAGE_BASE)
+    except (OSError, ValueError) as e:
+        print(f"❌ Erro ao carregar o modelo {schema_path}:")
+        for message in getattr(e, "errors", [str(e)]):
+            print(f"   - {message}")
+        return 1
+
+    manifest = None
+    if sink is None:
+        output_dir = OUTPUT_DIR if output_dir is None else output_dir
+        with measure(profiler, "manifest"):
+            manifest = Manifest.load(output_dir, force)
+        destination = f"{output_dir}/"
+    else:
+        destination = sink.location("").rstrip(":")
+
+    print(f"🚀 Gerando {len(contexts)} entidades a partir de {schema_path}...")
+    report = generate_model(contexts, output_dir, workers, manifest, sink, profiler)
+    if report.errors:
+        print_errors(report.errors)
+        return 1
+
+    print(f"\n🎉 {len(contexts)} entidades geradas em: {destination}")
+    print(f"   {report.summary()}")
+    return 0
+
+
+def cli(argv=None):
+    global OUTPUT_DIR
+
+    parser = argparse.ArgumentParser(description="Gerador de CRUD com JPA")
+    parser.add_argument(
+        "--schema",
+        "-s",
+        help="Arquivo de modelo (JSON/YAML) para gerar todas as entidades sem prompts",
+    )
+    parser.add_argument(
+        "--output", "-o", help=f"Diretório de saída (padrão: {OUTPUT_DIR})"
+    )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        help="Processos usados na renderização do modelo (padrão: número de CPUs)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenera todos os arquivos (o manifest ainda remove os que saíram do modelo)",
+    )
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="Escreve o código gerado na saída padrão em vez de gravar arquivos",
+    )
+    parser.add_argument(
+        "--archive",
+        metavar="ARQUIVO",
+        help="Empacota o código gerado em um .zip/.tar/.tar.gz ('-' para a saída padrão)",
+    )
+    parser.add_argument(
+        "--archive-format",
+        choices=sorted(set(ARCHIVE_FORMATS.values())),
+        help="Formato do pacote (padrão: deduzido da extensão; zip para '-')",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Mostra os tempos de cada fase e de cada template ao final",
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="ARQUIVO",
+        help="Grava os tempos de cada fase e de cada template em JSON",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="ARQUIVO",
+        help="Grava um perfil cProfile (pstats) do processo principal",
+    )
+    args = parser.parse_args(argv)
+
+    if args.archive and not args.schema:
+        parser.error("--archive requer --schema")
+    if args.stdout and not args.schema:
+        parser.error("--stdout requer --schema")
+    if args.stdout and args.archive:
+        parser.error("--stdout e --archive não podem ser usados juntos")
+
+    profiler = None
+    if args.profile or args.profile_json or args.cprofile:
+        profiler = Profiler(args.cprofile)
+        profiler.start()
+
+    try:
+        if args.archive:
+            return generate_archive(args, profiler)
+
+        if args.schema and args.stdout:
+            # The sink owns stdout; progress messages go to stderr
+            with StdoutSink() as sink, contextlib.redirect_stdout(sys.stderr):
+                return generate_from_schema(
+                    args.schema, workers=args.workers, sink=sink, profiler=profiler
+                )
+
+        if args.schema:
+            return generate_from_schema(
+                args.schema,
+                args.output,
+                args.workers,
+                args.force,
+                profiler=profiler,
+            )
+
+        if args.output:
+            OUTPUT_DIR = args.output
+        main(profiler)
+        return 0
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            report_profile(profiler, args)
+
+
+def generate_archive(args, profiler=None):
+    """--archive: gera o modelo direto em um pacote zip/tar"""
+    try:
+        sink = open_archive(args.archive, args.archive_format)
+    except (OSError, ValueError) as e:
+        print(f"❌ Erro ao criar o pacote: {e}")
+        return 1
+    # One rendered file in memory at a time unless more workers are asked for
+    workers = args.workers or 1
+    try:
+        with contextlib.ExitStack() as stack:
+            if args.archive == "-":
+                # The archive owns stdout; progress messages go to stderr
+                stack.enter_context(contextlib.redirect_stdout(sys.stderr))
+            exit_code = generate_from_schema(
+                args.schema, workers=workers, sink=sink, profiler=profiler
+            )
+    except BaseException:
+        sink.abort()
+        raise
+    # A failed generation never publishes a partial archive
+    if exit_code:
+        sink.abort()
+    else:
+        sink.close()
+    return exit_code
+
+
+def report_profile(profiler, args):
+    """Mostra/grava os tempos coletados conforme --profile/--profile-json"""
+    # Keep stdout clean when it carries generated code
+    stream = sys.stderr if args.stdout or args.archive == "-" else sys.stdout
+    if args.profile:
+        print(profiler.summary_table(), file=stream)
+    if args.profile_json:
+        profiler.save_json(args.profile_json)
+        print(f"⏱️  Tempos gravados em {args.profile_json}", file=stream)
+
+
+def main(profiler=None):
     print("╔══════════════════════════════════════╗")
     print("║           GGV-AUTO-CRUD              ║")
     print("║     Gerador de CRUD com JPA          ║")
@@ -214,6 +761,7 @@ def main():
                 f"      - {field['name']}: {field['type']} → Coluna: {column_name}"
                 + (f" (max: {field['length']})" if field.get("length") else "")
                 + (" [positivo]" if field.get("positive") else "")
+                + (" [pesquisável]" if field.get("searchable") else "")
             )
 
     if relationships:
@@ -231,46 +779,20 @@ def main():
         print("❌ Operação cancelada.")
         return
 
-    context = {
-        "entity_name": entity_name,
-        "table_name": table_name,
-        "package_base": PACKAGE_BASE,
-        "fields": fields,
-        "relationships": relationships,
-    }
-
-    templates = [
-        ("entity.java.j2", f"{OUTPUT_DIR}/{entity_name}/{entity_name}.java"),
-        (
-            "repository.java.j2",
-            f"{OUTPUT_DIR}/{entity_name}/{entity_name}Repository.java",
-        ),
-        ("request.java.j2", f"{OUTPUT_DIR}/{entity_name}/{entity_name}Request.java"),
-        ("response.java.j2", f"{OUTPUT_DIR}/{entity_name}/{entity_name}Response.java"),
-        ("mapper.java.j2", f"{OUTPUT_DIR}/{entity_name}/{entity_name}Mapper.java"),
-        ("service.java.j2", f"{OUTPUT_DIR}/{entity_name}/{entity_name}Service.java"),
-        (
-            "controller.java.j2",
-            f"{OUTPUT_DIR}/{entity_name}/{entity_name}Controller.java",
-        ),
-        (
-            "service_test.java.j2",
-            f"{OUTPUT_DIR}/{entity_name}/{entity_name}ServiceTest.java",
-        ),
-        (
-            "controller_test.java.j2",
-            f"{OUTPUT_DIR}/{entity_name}/{entity_name}ControllerTest.java",
-        ),
-    ]
+    with measure(profiler, "parse"):
+        context = build_context(
+            entity_name, table_name, fields, relationships, PACKAGE_BASE
+        )
+    templates = artifact_paths(entity_name)
 
     print(f"\n🚀 Gerando arquivos para {entity_name}...")
 
-    for template_name, output_path in templates:
-        try:
-            render_template(template_name, context, output_path)
-        except Exception as e:
-            print(f"❌ Erro ao gerar {output_path}: {e}")
-            return
+    # Uma única entidade não compensa o custo de subir o pool de processos
+    report = generate_model([context], workers=1, profiler=profiler)
+    if report.errors:
+        print_errors(report.errors)
+        return
+    print(f"   {report.summary()}")
 
     print(
         f"\n🎉 Todos os arquivos foram gerados com sucesso em: {OUTPUT_DIR}/{entity_name}/"
@@ -281,4 +803,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(cli())
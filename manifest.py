@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import re
+from config import TEMPLATE_DIR
+from writer import write_if_changed
+
+MANIFEST_FILE = ".ggv-manifest.json"
+MANIFEST_VERSION = 1
+
+# Templates referenced by another ({% import "x" %}, {% include "x" %}, ...)
+TEMPLATE_REFERENCE = re.compile(r'{%-?\s*(?:import|include|from|extends)\s+"([^"]+)"')
+
+
+def _sha256(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_context(context):
+    """Hash estável do contexto de uma entidade (independe da ordem das chaves)"""
+    return _sha256(json.dumps(context, sort_keys=True, ensure_ascii=False, default=str))
+
+
+def hash_template(template_name, template_dir=TEMPLATE_DIR):
+    """Hash do template e dos templates que ele importa/inclui (ex: _indexes.j2)"""
+    return _template_digest(template_name, template_dir)
+
+
+def _template_digest(template_name, template_dir):
+    with open(os.path.join(template_dir, template_name), encoding="utf-8") as f:
+        source = f.read()
+    digest = _sha256(source)
+    for name in sorted(set(TEMPLATE_REFERENCE.findall(source))):
+        digest = _sha256(f"{digest}:{name}:{_template_digest(name, template_dir)}")
+    return digest
+
+
+def hash_file(path):
+    try:
+        with open(path, "rb") as f:
+            return _sha256(f.read())
+    except OSError:
+        return None
+
+
+class Manifest:
+    """
+    Registro da última geração em um diretório de saída.
+
+    Guarda o hash do contexto de cada entidade, o hash de cada template
+    e, por arquivo gerado, o hash das entradas (contexto + template) e
+    do conteúdo escrito. Um arquivo só precisa ser renderizado de novo
+    quando alguma entrada mudou ou quando o arquivo em disco não é mais
+    o que foi gerado (apagado ou editado à mão).
+
+    Com force=True todo arquivo é considerado desatualizado, mas os
+    registros anteriores continuam valendo para remover os arquivos que
+    saíram do modelo.
+    """
+
+    def __init__(self, output_dir, data=None, force=False):
+        self.output_dir = output_dir
+        self.force = force
+        self.path = os.path.join(output_dir, MANIFEST_FILE)
+        data = data or {}
+        if data.get("version") != MANIFEST_VERSION:
+            data = {}
+        self.previous_artifacts = data.get("artifacts", {})
+        self.entities = {}
+        self.templates = {}
+        self.artifacts = {}
+        self._template_hashes = {}
+
+    @classmethod
+    def load(cls, output_dir, force=False):
+        try:
+            with open(os.path.join(output_dir, MANIFEST_FILE), encoding="utf-8") as f:
+                return cls(output_dir, json.load(f), force)
+        except (OSError, ValueError):
+            return cls(output_dir, force=force)
+
+    def template_hash(self, template_name):
+        if template_name not in self._template_hashes:
+            self._template_hashes[template_name] = hash_template(template_name)
+        return self._template_hashes[template_name]
+
+    def input_hash(self, context, context_hash, template_name):
+        """Hash de todas as entradas de um arquivo gerado"""
+        template_hash = self.template_hash(template_name)
+        if "entity_name" in context:
+            # Model-level artifacts (application.properties) have no entity
+            self.entities[context["entity_name"]] = context_hash
+        self.templates[template_name] = template_hash
+        return _sha256(f"{context_hash}:{template_name}:{template_hash}")
+
+    def _key(self, output_path):
+        return os.path.relpath(output_path, self.output_dir).replace(os.sep, "/")
+
+    def is_current(self, output_path, input_hash):
+        """Indica se o arquivo em disco já corresponde a essas entradas"""
+        if self.force:
+            return False
+        previous = self.previous_artifacts.get(self._key(output_path))
+        if not previous or previous.get("input") != input_hash:
+            return False
+        return hash_file(output_path) == previous.get("output")
+
+    def is_locked(self, output_path, content):
+        """
+        Indica se o novo conteúdo reescreveria um arquivo já gerado e
+        intacto em disco (usado para migrations, que o Flyway já pode ter
+        aplicado). Com force=True nada fica travado.
+        """
+        if self.force:
+            return False
+        previous = self.previous_artifacts.get(self._key(output_path))
+        if not previous or _sha256(content) == previous.get("output"):
+            return False
+        return hash_file(output_path) == previous.get("output")
+
+    def keep(self, output_path):
+        """Mantém no novo manifest o registro de um arquivo que não foi regenerado"""
+        key = self._key(output_path)
+        self.artifacts[key] = self.previous_artifacts[key]
+
+    def record(self, output_path, input_hash, content):
+        self.artifacts[self._key(output_path)] = {
+            "input": input_hash,
+            "output": _sha256(content),
+        }
+
+    def stale_paths(self, current_paths):
+        """Arquivos da geração anterior que não fazem mais parte do modelo"""
+        current = {self._key(path) for path in current_paths}
+        return [
+            os.path.join(self.output_dir, *key.split("/"))
+            for key in sorted(self.previous_artifacts)
+            if key not in current
+        ]
+
+    def save(self):
+        """Grava o manifest atomicamente (só se houver mudanças)"""
+        data = {
+            "version": MANIFEST_VERSION,
+            "templates": dict(sorted(self.templates.items())),
+            "entities": dict(sorted(self.entities.items())),
+            "artifacts": dict(sorted(self.artifacts.items())),
+        }
+        write_if_changed(self.path, json.dumps(data, indent=2, ensure_ascii=False))
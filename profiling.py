@@ -0,0 +1,120 @@
+import contextlib
+import cProfile
+import json
+import time
+
+# Phases in the order they happen in a generation run
+PHASES = ["parse", "manifest", "compile", "render", "write"]
+
+
+class Profiler:
+    """
+    Tempos de uma execução do gerador, por fase e por template.
+
+    As fases são acumuladas em segundos: parse (leitura e validação do
+    modelo), manifest (hashes e comparação com a última geração),
+    compile (carga/compilação dos templates), render e write (gravação
+    no destino). Com vários workers, compile e render somam o tempo de
+    todos os processos e podem passar do tempo total.
+
+    Com cprofile_path, a execução do processo principal também é
+    registrada pelo cProfile e gravada nesse arquivo (formato pstats).
+    """
+
+    def __init__(self, cprofile_path=None):
+        self.phases = {}
+        self.templates = {}
+        self.total = 0.0
+        self.cprofile_path = cprofile_path
+        self._cprofile = cProfile.Profile() if cprofile_path else None
+        self._started = None
+
+    def start(self):
+        self._started = time.perf_counter()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def stop(self):
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.cprofile_path)
+        if self._started is not None:
+            self.total += time.perf_counter() - self._started
+            self._started = None
+
+    def add(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def record_template(self, template_name, compile_seconds, render_seconds):
+        """Registra uma renderização de template (tempos medidos no worker)"""
+        stats = self.templates.setdefault(
+            template_name, {"count": 0, "compile": 0.0, "render": 0.0}
+        )
+        stats["count"] += 1
+        stats["compile"] += compile_seconds
+        stats["render"] += render_seconds
+        self.add("compile", compile_seconds)
+        self.add("render", render_seconds)
+
+    def to_dict(self):
+        ordered = sorted(
+            self.phases,
+            key=lambda p: PHASES.index(p) if p in PHASES else len(PHASES),
+        )
+        return {
+            "total_ms": self.total * 1000,
+            "phases_ms": {name: self.phases[name] * 1000 for name in ordered},
+            "templates": {
+                name: {
+                    "count": stats["count"],
+                    "compile_ms": stats["compile"] * 1000,
+                    "render_ms": stats["render"] * 1000,
+                }
+                for name, stats in sorted(
+                    self.templates.items(), key=lambda item: -item[1]["render"]
+                )
+            },
+        }
+
+    def save_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def summary_table(self):
+        data = self.to_dict()
+        lines = ["", "⏱️  Tempos por fase", f"   {'fase':24} {'ms':>10} {'%':>6}"]
+        for name, ms in data["phases_ms"].items():
+            share = ms / data["total_ms"] if data["total_ms"] else 0
+            lines.append(f"   {name:24} {ms:10.1f} {share:6.1%}")
+        lines.append(f"   {'total':24} {data['total_ms']:10.1f}")
+
+        if data["templates"]:
+            lines += [
+                "",
+                "⏱️  Tempos por template",
+                f"   {'template':24} {'arquivos':>8} {'compile ms':>11} {'render ms':>10}",
+            ]
+            for name, stats in data["templates"].items():
+                lines.append(
+                    f"   {name:24} {stats['count']:8} "
+                    f"{stats['compile_ms']:11.1f} {stats['render_ms']:10.1f}"
+                )
+
+        if self.cprofile_path:
+            lines += ["", f"   cProfile gravado em {self.cprofile_path}"]
+        return "\n".join(lines)
+
+
+def measure(profiler, phase):
+    """profiler.phase(phase), ou nada quando o profiler está desligado"""
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.phase(phase)
@@ -0,0 +1,501 @@
+import json
+import os
+from config import ENTITY_OPTIONS
+
+FIELD_TYPES = [
+    "String",
+    "Integer",
+    "Long",
+    "Double",
+    "Float",
+    "Boolean",
+    "LocalDateTime",
+    "LocalDate",
+    "UUID",
+    "BigDecimal",
+]
+
+# Opções aceitas no quarto trecho do campo (nome:tipo:length:flags)
+FIELD_FLAGS = ["positive", "searchable", "index"]
+
+RELATIONSHIP_TYPES = ["OneToMany", "ManyToOne", "OneToOne", "ManyToMany"]
+
+# Valores aceitos pelas opções de entidade que não são livres
+OPTION_CHOICES = {
+    "pagination": ["offset", "keyset", "unbounded"],
+    "id_strategy": ["identity", "sequence"],
+    "migration": ["none", "flyway"],
+    "async": ["none", "virtual_threads", "completable_future"],
+}
+
+
+class SchemaError(ValueError):
+    """Erro de validação do arquivo de modelo (acumula todas as mensagens)"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        super().__init__("\n".join(self.errors))
+
+
+def parse_field(entry):
+    """
+    Converte uma entrada no formato nome:tipo[:length][:flags]
+    no dicionário de campo usado pelos templates.
+
+    flags é uma lista separada por vírgula: positive, searchable e
+    index (índice só da coluna) ou index=grupo (índice composto pelos
+    campos do mesmo grupo, na ordem em que foram declarados).
+
+    Lança ValueError com a mensagem de erro em caso de entrada inválida.
+    """
+    parts = entry.split(":")
+    if len(parts) < 2:
+        raise ValueError(
+            "você precisa digitar pelo menos nome e tipo\n   Exemplo: nome:String"
+        )
+
+    field_name = parts[0].strip()
+    field_type = parts[1].strip()
+
+    if field_type not in FIELD_TYPES:
+        raise ValueError(
+            f"tipo '{field_type}' não suportado. Use: {', '.join(FIELD_TYPES)}"
+        )
+
+    flags = {}
+    if len(parts) > 3 and parts[3].strip():
+        for flag in parts[3].split(","):
+            key, _, value = flag.partition("=")
+            key = key.strip().lower()
+            if key not in FIELD_FLAGS or (value and key != "index"):
+                raise ValueError(
+                    f"opção de campo '{flag.strip()}' não suportada. "
+                    f"Use: {', '.join(FIELD_FLAGS)} ou index=grupo"
+                )
+            flags[key] = value.strip() or True
+
+    return {
+        "name": field_name,
+        "type": field_type,
+        "length": (
+            int(parts[2]) if len(parts) > 2 and parts[2].strip().isdigit() else None
+        ),
+        "not_null": True,
+        "positive": "positive" in flags,
+        "searchable": "searchable" in flags,
+        "index": flags.get("index", False),
+    }
+
+
+def parse_relationship(entry):
+    """
+    Converte uma entrada no formato nome:tipo:target[:mapped_by][:options]
+    no dicionário de relacionamento usado pelos templates.
+
+    Lança ValueError com a mensagem de erro em caso de entrada inválida.
+    """
+    parts = entry.split(":")
+    if len(parts) < 3:
+        raise ValueError(
+            "formato mínimo é nome:tipo:target\n   Exemplo: pedidos:OneToMany:Pedido"
+        )
+
+    rel_name = parts[0].strip()
+    rel_type = parts[1].strip()
+    rel_target = parts[2].strip()
+
+    if rel_type not in RELATIONSHIP_TYPES:
+        raise ValueError(
+            f"tipo '{rel_type}' não suportado. Use: {', '.join(RELATIONSHIP_TYPES)}"
+        )
+
+    # Parse mapped_by
+    mapped_by = parts[3].strip() if len(parts) > 3 and parts[3].strip() else None
+
+    # Parse options
+    options = {}
+    if len(parts) > 4 and parts[4].strip():
+        option_parts = [opt.strip() for opt in parts[4].split(",")]
+        for opt in option_parts:
+            if "=" in opt:
+                key, value = opt.split("=", 1)
+                options[key.strip()] = value.strip()
+            else:
+                options[opt] = True
+
+    return {
+        "name": rel_name,
+        "type": rel_type,
+        "target": rel_target,
+        "mapped_by": mapped_by,
+        "cascade": options.get("cascade", False),
+        "not_null": options.get("not_null", False),
+        "owner": options.get("owner", False),
+        "inverse_field": options.get("inverse_field", None),
+    }
+
+
+def normalize_field(spec):
+    """Aceita um campo no formato texto ou dicionário e devolve o dicionário completo"""
+    if isinstance(spec, str):
+        return parse_field(spec)
+    if not isinstance(spec, dict):
+        raise ValueError(f"campo inválido: {spec!r}")
+    if not spec.get("name") or not spec.get("type"):
+        raise ValueError(f"campo precisa de 'name' e 'type': {spec!r}")
+    if spec["type"] not in FIELD_TYPES:
+        raise ValueError(
+            f"tipo '{spec['type']}' não suportado. Use: {', '.join(FIELD_TYPES)}"
+        )
+
+    field = {
+        "name": spec["name"],
+        "type": spec["type"],
+        "length": spec.get("length"),
+        "not_null": spec.get("not_null", True),
+        "positive": spec.get("positive", False),
+        "searchable": spec.get("searchable", False),
+        "index": spec.get("index", False),
+    }
+    length = field["length"]
+    if length is not None and (
+        isinstance(length, bool) or not isinstance(length, int) or length < 1
+    ):
+        raise ValueError(f"length precisa ser um inteiro positivo: {length!r}")
+    if not isinstance(field["index"], (bool, str)):
+        raise ValueError(
+            f"index precisa ser true, false ou o nome do grupo: {field['index']!r}"
+        )
+    # Preserve extra keys (template options) the prompts don't produce
+    for key, value in spec.items():
+        field.setdefault(key, value)
+    return field
+
+
+def normalize_relationship(spec):
+    """Aceita um relacionamento no formato texto ou dicionário e devolve o dicionário completo"""
+    if isinstance(spec, str):
+        return parse_relationship(spec)
+    if not isinstance(spec, dict):
+        raise ValueError(f"relacionamento inválido: {spec!r}")
+    missing = [key for key in ("name", "type", "target") if not spec.get(key)]
+    if missing:
+        raise ValueError(
+            f"relacionamento precisa de {', '.join(repr(k) for k in missing)}: {spec!r}"
+        )
+    if spec["type"] not in RELATIONSHIP_TYPES:
+        raise ValueError(
+            f"tipo '{spec['type']}' não suportado. Use: {', '.join(RELATIONSHIP_TYPES)}"
+        )
+
+    relationship = {
+        "name": spec["name"],
+        "type": spec["type"],
+        "target": spec["target"],
+        "mapped_by": spec.get("mapped_by"),
+        "cascade": spec.get("cascade", False),
+        "not_null": spec.get("not_null", False),
+        "owner": spec.get("owner", False),
+        "inverse_field": spec.get("inverse_field"),
+    }
+    for key, value in spec.items():
+        relationship.setdefault(key, value)
+    return relationship
+
+
+def normalize_options(spec):
+    """
+    Valida as opções de uma entidade e devolve o dicionário completo,
+    com os padrões de config.ENTITY_OPTIONS para as chaves ausentes.
+
+    Lança ValueError com a mensagem de erro em caso de opção inválida.
+    """
+    spec = spec or {}
+    if not isinstance(spec, dict):
+        raise ValueError(f"options precisa ser um dicionário: {spec!r}")
+
+    unknown = sorted(key for key in spec if key not in ENTITY_OPTIONS)
+    if unknown:
+        raise ValueError(
+            f"opção '{unknown[0]}' desconhecida. Use: {', '.join(ENTITY_OPTIONS)}"
+        )
+    for key, choices in OPTION_CHOICES.items():
+        if key in spec and spec[key] not in choices:
+            raise ValueError(
+                f"{key} '{spec[key]}' não suportado. Use: {', '.join(choices)}"
+            )
+    for key, default in ENTITY_OPTIONS.items():
+        if key not in spec:
+            continue
+        if isinstance(default, bool):
+            if not isinstance(spec[key], bool):
+                raise ValueError(f"{key} precisa ser true ou false: {spec[key]!r}")
+        elif isinstance(default, int):
+            if (
+                isinstance(spec[key], bool)
+                or not isinstance(spec[key], int)
+                or spec[key] < 1
+            ):
+                raise ValueError(
+                    f"{key} precisa ser um inteiro positivo: {spec[key]!r}"
+                )
+
+    options = dict(ENTITY_OPTIONS)
+    options.update(spec)
+    return options
+
+
+def build_context(
+    entity_name, table_name, fields, relationships, package_base, options=None
+):
+    """Monta o contexto de renderização de uma entidade"""
+    return {
+        "entity_name": entity_name,
+        "table_name": table_name,
+        "package_base": package_base,
+        "fields": fields,
+        "relationships": relationships,
+        "options": normalize_options(options),
+    }
+
+
+def _accessor(name):
+    """Sufixo do getter/setter de uma propriedade (pedidos -> Pedidos)"""
+    return name[:1].upper() + name[1:]
+
+
+class ModelIndex:
+    """
+    Índice do modelo inteiro: entidade -> campos, relacionamentos e lados
+    inversos, montado uma única vez por execução.
+
+    Resolve as duas pontas de cada relacionamento em tempo linear e
+    acumula em errors as referências que o código gerado não conseguiria
+    compilar (alvo inexistente, mappedBy ou inverse_field sem o campo
+    correspondente na entidade alvo). Os relacionamentos resolvidos
+    recebem "inverse" (nome do campo na entidade alvo) e
+    "inverse_accessor" (sufixo do getter/setter), usados pelos templates.
+    """
+
+    def __init__(self, contexts):
+        self.entities = {context["entity_name"]: context for context in contexts}
+        self._fields = {
+            name: {field["name"]: field for field in context["fields"]}
+            for name, context in self.entities.items()
+        }
+        self._relationships = {
+            name: {rel["name"]: rel for rel in context["relationships"]}
+            for name, context in self.entities.items()
+        }
+        self._incoming = {name: [] for name in self.entities}
+        self.errors = []
+
+        for name, context in self.entities.items():
+            for rel in context["relationships"]:
+                if rel["target"] in self._incoming:
+                    self._incoming[rel["target"]].append((name, rel))
+                self._resolve(name, rel)
+
+        # Owning sides learn their inverse from the side that declared mappedBy
+        for name, context in self.entities.items():
+            for rel in context["relationships"]:
+                inverse = self.inverse_of(name, rel["name"])
+                if inverse is not None and not inverse["inverse"]:
+                    inverse["inverse"] = rel["name"]
+                    inverse["inverse_accessor"] = _accessor(rel["name"])
+
+    def entity(self, name):
+        return self.entities.get(name)
+
+    def field(self, entity_name, field_name):
+        return self._fields.get(entity_name, {}).get(field_name)
+
+    def relationship(self, entity_name, rel_name):
+        return self._relationships.get(entity_name, {}).get(rel_name)
+
+    def relationships_to(self, entity_name):
+        """Relacionamentos (entidade, rel) de outras entidades que apontam para esta"""
+        return list(self._incoming.get(entity_name, []))
+
+    def inverse_of(self, entity_name, rel_name):
+        """Relacionamento do outro lado, na entidade alvo (ou None)"""
+        rel = self.relationship(entity_name, rel_name)
+        if not rel or not rel.get("inverse"):
+            return None
+        return self.relationship(rel["target"], rel["inverse"])
+
+    def _error(self, entity_name, rel, message):
+        self.errors.append(f"{entity_name}.{rel['name']}: {message}")
+
+    def _expect_inverse(self, entity_name, rel, inverse_name, inverse_types):
+        """Confere que inverse_name existe no alvo, aponta de volta e tem o tipo certo"""
+        target = rel["target"]
+        inverse = self.relationship(target, inverse_name)
+        expected = " ou ".join(inverse_types)
+        if inverse is None:
+            self._error(
+                entity_name,
+                rel,
+                f"'{inverse_name}' não existe em {target}"
+                f"\n   Exemplo: {inverse_name}:{inverse_types[0]}:{entity_name}",
+            )
+            return
+        if inverse["target"] != entity_name or inverse["type"] not in inverse_types:
+            self._error(
+                entity_name,
+                rel,
+                f"{target}.{inverse_name} é {inverse['type']} -> {inverse['target']}, "
+                f"esperado {expected} -> {entity_name}",
+            )
+            return
+        rel["inverse"] = inverse_name
+        rel["inverse_accessor"] = _accessor(inverse_name)
+
+    def _resolve(self, entity_name, rel):
+        rel.setdefault("inverse", None)
+        rel.setdefault("inverse_accessor", None)
+        if rel["target"] not in self.entities:
+            self._error(
+                entity_name,
+                rel,
+                f"entidade alvo '{rel['target']}' não existe no modelo",
+            )
+            return
+
+        if rel["type"] == "OneToMany":
+            # entity.java.j2 defaults mappedBy to the lowercased entity name
+            mapped_by = rel.get("mapped_by") or entity_name.lower()
+            self._expect_inverse(entity_name, rel, mapped_by, ["ManyToOne"])
+        elif rel["type"] == "OneToOne" and rel.get("mapped_by"):
+            self._expect_inverse(entity_name, rel, rel["mapped_by"], ["OneToOne"])
+        elif rel["type"] == "ManyToMany":
+            # The add/remove helpers call target.get<inverse_field>()
+            inverse_field = rel.get("inverse_field") or f"{entity_name}s"
+            inverse_name = inverse_field[:1].lower() + inverse_field[1:]
+            self._expect_inverse(entity_name, rel, inverse_name, ["ManyToMany"])
+
+
+def read_model_file(path):
+    """Lê o arquivo de modelo (JSON ou YAML) e devolve a estrutura bruta"""
+    with open(path, "r", encoding="utf-8") as f:
+        raw = f.read()
+
+    if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise SchemaError(
+                [
+                    "PyYAML não está instalado. Use 'pip install pyyaml' ou um arquivo JSON."
+                ]
+            )
+        try:
+            return yaml.safe_load(raw) or {}
+        except yaml.YAMLError as e:
+            raise SchemaError([f"{path}: YAML inválido: {e}"])
+
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise SchemaError([f"{path}: JSON inválido: {e}"])
+
+
+def load_model(data, package_base):
+    """
+    Converte a estrutura do modelo em uma lista de contextos de entidade.
+
+    Formato esperado:
+        {
+            "package_base": "com.erp",            # opcional
+            "entities": [
+                {
+                    "name": "Cliente",
+                    "table": "TB_CLIENTE",        # opcional (padrão: nome em minúsculo)
+                    "fields": ["nome:String:100", {"name": "email", "type": "String"}],
+                    "relationships": ["pedidos:OneToMany:Pedido:cliente:cascade"],
+                    "options": {"pagination": "offset"}  # opcional (config.ENTITY_OPTIONS)
+                }
+            ]
+        }
+
+    Campos e relacionamentos aceitam tanto o formato texto dos prompts
+    quanto os dicionários que os prompts produzem. Os relacionamentos são
+    validados contra o modelo inteiro (ModelIndex) e recebem o lado
+    inverso resolvido. Todos os erros são acumulados e lançados juntos
+    em um SchemaError.
+    """
+    if isinstance(data, str):
+        data = read_model_file(data)
+
+    if not isinstance(data, dict) or not isinstance(data.get("entities"), list):
+        raise SchemaError(["o modelo precisa de uma lista 'entities'"])
+
+    package_base = data.get("package_base", package_base)
+    errors = []
+    contexts = []
+    seen = set()
+
+    for index, spec in enumerate(data["entities"]):
+        if not isinstance(spec, dict):
+            errors.append(f"entities[{index}]: entidade inválida: {spec!r}")
+            continue
+
+        entity_name = spec.get("name") or spec.get("entity_name")
+        if not entity_name:
+            errors.append(f"entities[{index}]: nome da entidade é obrigatório")
+            continue
+        if entity_name in seen:
+            errors.append(f"{entity_name}: entidade duplicada no modelo")
+            continue
+        seen.add(entity_name)
+
+        table_name = spec.get("table") or spec.get("table_name") or entity_name.lower()
+
+        fields = []
+        for position, field_spec in enumerate(spec.get("fields") or []):
+            try:
+                fields.append(normalize_field(field_spec))
+            except ValueError as e:
+                errors.append(f"{entity_name}.fields[{position}]: {e}")
+
+        relationships = []
+        for position, rel_spec in enumerate(spec.get("relationships") or []):
+            try:
+                relationships.append(normalize_relationship(rel_spec))
+            except ValueError as e:
+                errors.append(f"{entity_name}.relationships[{position}]: {e}")
+
+        if not spec.get("fields") and not spec.get("relationships"):
+            errors.append(f"{entity_name}: nenhum campo ou relacionamento informado")
+
+        try:
+            options = normalize_options(spec.get("options"))
+        except ValueError as e:
+            errors.append(f"{entity_name}.options: {e}")
+            continue
+        collections = [
+            rel["name"]
+            for rel in relationships
+            if rel["type"] in ("OneToMany", "ManyToMany")
+        ]
+        if options["projections"] and collections:
+            errors.append(
+                f"{entity_name}.options: projections não suporta coleções "
+                f"({', '.join(collections)})"
+            )
+            continue
+
+        contexts.append(
+            build_context(
+                entity_name, table_name, fields, relationships, package_base, options
+            )
+        )
+
+    if errors:
+        raise SchemaError(errors)
+
+    index = ModelIndex(contexts)
+    if index.errors:
+        raise SchemaError(index.errors)
+
+    return contexts
@@ -0,0 +1,219 @@
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import zipfile
+from writer import _UMASK, write_if_changed
+
+
+class Sink:
+    """
+    Destino dos arquivos gerados.
+
+    Os artefatos são identificados por um nome relativo com "/" como
+    separador (ex: "Cliente/ClienteService.java"). Subclasses implementam
+    write(); close() finaliza o destino. Pode ser usado como context manager.
+    """
+
+    def write(self, name, content):
+        """Grava um artefato; devolve True se algo foi escrito"""
+        raise NotImplementedError
+
+    def location(self, name):
+        """Descrição de onde o artefato foi parar, para mensagens e relatórios"""
+        return name
+
+    def close(self):
+        pass
+
+    def abort(self):
+        """Finaliza o destino após uma falha (padrão: igual a close)"""
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class DirectorySink(Sink):
+    """Grava cada artefato em um arquivo sob root (atômico, só se mudou)"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def location(self, name):
+        return f"{self.root}/{name}"
+
+    def write(self, name, content):
+        return write_if_changed(self.location(name), content)
+
+
+class MemorySink(Sink):
+    """Guarda os artefatos em um dicionário nome -> código fonte"""
+
+    def __init__(self):
+        self.files = {}
+
+    def location(self, name):
+        return f"<memória>/{name}"
+
+    def write(self, name, content):
+        self.files[name] = content
+        return True
+
+
+class StdoutSink(Sink):
+    """Escreve todos os artefatos em sequência, separados por um cabeçalho"""
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+
+    def location(self, name):
+        return f"<stdout>/{name}"
+
+    def write(self, name, content):
+        self.stream.write(f"// ===== {name} =====\n")
+        self.stream.write(content)
+        if not content.endswith("\n"):
+            self.stream.write("\n")
+        return True
+
+    def close(self):
+        self.stream.flush()
+
+
+# Fixed timestamp so the same model always produces a byte-identical archive
+ARCHIVE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+ARCHIVE_FORMATS = {
+    ".zip": "zip",
+    ".tar": "tar",
+    ".tar.gz": "tar.gz",
+    ".tgz": "tar.gz",
+}
+
+
+class ArchiveSink(Sink):
+    """
+    Base dos sinks que empacotam os artefatos em um único arquivo.
+
+    Cada artefato é escrito no arquivo assim que é recebido, então só um
+    código fonte renderizado fica em memória por vez. Com um caminho, o
+    arquivo é montado em um temporário e renomeado no close(), para que
+    uma geração interrompida não deixe um pacote truncado; com "-" (ou
+    um stream binário já aberto), o pacote é transmitido direto.
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self._tmp_path = None
+        if target == "-":
+            self.label = "<stdout>"
+            self._fileobj = sys.stdout.buffer
+        elif not isinstance(target, str):
+            # Already-open binary stream (socket, pipe, BytesIO...)
+            self.label = "<stream>"
+            self._fileobj = target
+        else:
+            self.label = target
+            directory = os.path.dirname(os.path.abspath(target))
+            os.makedirs(directory, exist_ok=True)
+            fd, self._tmp_path = tempfile.mkstemp(
+                dir=directory, prefix=f".{os.path.basename(target)}.", suffix=".tmp"
+            )
+            self._fileobj = os.fdopen(fd, "wb")
+        self._archive = self._open(self._fileobj)
+
+    def _open(self, fileobj):
+        raise NotImplementedError
+
+    def location(self, name):
+        return f"{self.label}:{name}"
+
+    def close(self):
+        self._archive.close()
+        if self._tmp_path is None:
+            self._fileobj.flush()
+            return
+        self._fileobj.close()
+        os.chmod(self._tmp_path, 0o666 & ~_UMASK)
+        os.replace(self._tmp_path, self.target)
+
+    def abort(self):
+        try:
+            self._archive.close()
+        finally:
+            if self._tmp_path is None:
+                self._fileobj.flush()
+            else:
+                self._fileobj.close()
+                os.unlink(self._tmp_path)
+
+
+class ZipSink(ArchiveSink):
+    """Empacota os artefatos em um .zip (funciona também em streams sem seek)"""
+
+    def _open(self, fileobj):
+        return zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def write(self, name, content):
+        info = zipfile.ZipInfo(name, date_time=ARCHIVE_DATE_TIME)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        self._archive.writestr(info, content.encode("utf-8"))
+        return True
+
+
+class TarSink(ArchiveSink):
+    """Empacota os artefatos em um .tar (opcionalmente gzip) no modo stream"""
+
+    def __init__(self, target, compression=""):
+        self.compression = compression
+        super().__init__(target)
+
+    def _open(self, fileobj):
+        return tarfile.open(
+            fileobj=fileobj, mode=f"w|{self.compression}", format=tarfile.PAX_FORMAT
+        )
+
+    def write(self, name, content):
+        data = content.encode("utf-8")
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mode = 0o644
+        info.mtime = 0
+        self._archive.addfile(info, io.BytesIO(data))
+        return True
+
+
+def archive_format(target, fmt=None):
+    """Formato do pacote: explícito ou deduzido da extensão do arquivo"""
+    if fmt:
+        return fmt
+    for extension, detected in sorted(
+        ARCHIVE_FORMATS.items(), key=lambda i: -len(i[0])
+    ):
+        if target.lower().endswith(extension):
+            return detected
+    raise ValueError(
+        f"não foi possível deduzir o formato de '{target}'. "
+        f"Use uma extensão ({', '.join(ARCHIVE_FORMATS)}) ou --archive-format"
+    )
+
+
+def open_archive(target, fmt=None):
+    """Cria o sink de pacote para target ("-" é a saída padrão; padrão zip)"""
+    fmt = archive_format(target, fmt or ("zip" if target == "-" else None))
+    if fmt == "zip":
+        return ZipSink(target)
+    if fmt == "tar":
+        return TarSink(target)
+    if fmt == "tar.gz":
+        return TarSink(target, "gz")
+    raise ValueError(f"formato de pacote '{fmt}' não suportado")
@@ -19,7 +19,20 @@ from tests.test_relationships import (
     TestRelationshipValidation,
 )
 from tests.test_edge_cases import TestEdgeCases, TestSpecialScenarios
-from tests.test_integration import TestIntegration, TestPerformance
+from tests.test_integration import (
+    TestIntegration,
+    TestTemplateCache,
+    TestOutputWriter,
+    TestPerformance,
+)
+from tests.test_batch import (
+    TestModelIndex,
+    TestSchemaLoading,
+    TestBatchGeneration,
+    TestIncrementalGeneration,
+)
+from tests.test_sinks import TestArchiveSinks, TestRenderEntity, TestSinks
+from tests.test_profiling import TestProfiling
 
 
 def create_test_suite():
@@ -49,7 +62,21 @@ def create_test_suite():
 
     # Testes de integração
     suite.addTest(unittest.makeSuite(TestIntegration))
+    suite.addTest(unittest.makeSuite(TestTemplateCache))
+    suite.addTest(unittest.makeSuite(TestOutputWriter))
     suite.addTest(unittest.makeSuite(TestPerformance))
+    suite.addTest(unittest.makeSuite(TestProfiling))
+
+    # Testes de geração em lote
+    suite.addTest(unittest.makeSuite(TestSchemaLoading))
+    suite.addTest(unittest.makeSuite(TestModelIndex))
+    suite.addTest(unittest.makeSuite(TestBatchGeneration))
+    suite.addTest(unittest.makeSuite(TestIncrementalGeneration))
+
+    # Testes de renderização em memória e destinos de saída
+    suite.addTest(unittest.makeSuite(TestRenderEntity))
+    suite.addTest(unittest.makeSuite(TestSinks))
+    suite.addTest(unittest.makeSuite(TestArchiveSinks))
 
     return suite
 
@@ -77,11 +104,23 @@ def run_specific_test_category(category):
         suite.addTest(unittest.makeSuite(TestSpecialScenarios))
     elif category == "integration":
         suite.addTest(unittest.makeSuite(TestIntegration))
+        suite.addTest(unittest.makeSuite(TestTemplateCache))
+        suite.addTest(unittest.makeSuite(TestOutputWriter))
         suite.addTest(unittest.makeSuite(TestPerformance))
+        suite.addTest(unittest.makeSuite(TestProfiling))
+    elif category == "batch":
+        suite.addTest(unittest.makeSuite(TestSchemaLoading))
+        suite.addTest(unittest.makeSuite(TestModelIndex))
+        suite.addTest(unittest.makeSuite(TestBatchGeneration))
+        suite.addTest(unittest.makeSuite(TestIncrementalGeneration))
+    elif category == "sinks":
+        suite.addTest(unittest.makeSuite(TestRenderEntity))
+        suite.addTest(unittest.makeSuite(TestSinks))
+        suite.addTest(unittest.makeSuite(TestArchiveSinks))
     else:
         print(f"Categoria '{category}' não encontrada!")
         print(
-            "Categorias disponíveis: validation, templates, relationships, edge_cases, integration"
+            "Categorias disponíveis: validation, templates, relationships, edge_cases, integration, batch, sinks"
         )
         return
 
@@ -103,6 +142,8 @@ if __name__ == "__main__":
             "relationships",
             "edge_cases",
             "integration",
+            "batch",
+            "sinks",
         ],
         help="Executar apenas uma categoria específica de testes",
     )
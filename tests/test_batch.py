@@ -0,0 +1,788 @@
+import unittest
+import io
+import os
+import json
+import sys
+from unittest.mock import patch
+
+# Import modules to test
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import TEMPLATES, cli, generate_model, model_artifacts
+from schema import ModelIndex, SchemaError, load_model
+from manifest import MANIFEST_FILE, Manifest
+import manifest as manifest_module
+from config import (
+    ASYNC_POOL_SIZE,
+    ASYNC_QUEUE_CAPACITY,
+    ASYNC_TIMEOUT_SECONDS,
+    ENTITY_OPTIONS,
+    JDBC_BATCH_SIZE,
+    PACKAGE_BASE,
+)
+from tests.test_base import BaseTestCase
+
+
+class TestSchemaLoading(BaseTestCase):
+    """Testes para leitura do arquivo de modelo"""
+
+    def get_model(self):
+        """Modelo com duas entidades relacionadas"""
+        return {
+            "entities": [
+                {
+                    "name": "Cliente",
+                    "table": "TB_CLIENTE",
+                    "fields": ["nome:String:100", "email:String:255"],
+                    "relationships": ["pedidos:OneToMany:Pedido:cliente:cascade"],
+                },
+                {
+                    "name": "Pedido",
+                    "fields": [
+                        {"name": "total", "type": "BigDecimal", "positive": True}
+                    ],
+                    "relationships": [
+                        {"name": "cliente", "type": "ManyToOne", "target": "Cliente"}
+                    ],
+                },
+            ]
+        }
+
+    def test_load_model_text_and_dict_formats(self):
+        """Testa que texto e dicionário produzem o mesmo formato dos prompts"""
+        contexts = load_model(self.get_model(), PACKAGE_BASE)
+
+        self.assertEqual(len(contexts), 2)
+        cliente, pedido = contexts
+
+        self.assertEqual(cliente["entity_name"], "Cliente")
+        self.assertEqual(cliente["table_name"], "TB_CLIENTE")
+        self.assertEqual(cliente["package_base"], PACKAGE_BASE)
+        self.assertEqual(
+            cliente["fields"][0],
+            {
+                "name": "nome",
+                "type": "String",
+                "length": 100,
+                "not_null": True,
+                "positive": False,
+                "searchable": False,
+                "index": False,
+            },
+        )
+        self.assertEqual(cliente["relationships"][0]["mapped_by"], "cliente")
+        self.assertTrue(cliente["relationships"][0]["cascade"])
+
+        # Tabela padrão e valores padrão dos dicionários
+        self.assertEqual(pedido["table_name"], "pedido")
+        self.assertTrue(pedido["fields"][0]["not_null"])
+        self.assertTrue(pedido["fields"][0]["positive"])
+        self.assertIsNone(pedido["relationships"][0]["mapped_by"])
+        self.assertFalse(pedido["relationships"][0]["not_null"])
+
+    def test_load_model_package_base_override(self):
+        """Testa package_base definido no próprio modelo"""
+        model = self.get_model()
+        model["package_base"] = "com.acme"
+
+        contexts = load_model(model, PACKAGE_BASE)
+
+        self.assertEqual(contexts[0]["package_base"], "com.acme")
+
+    def test_load_model_collects_all_errors(self):
+        """Testa que todos os erros do modelo são reportados juntos"""
+        model = {
+            "entities": [
+                {"name": "Cliente", "fields": ["nome:Texto", "idade"]},
+                {"name": "Cliente", "fields": ["nome:String"]},
+                {"fields": ["nome:String"]},
+                {"name": "Vazio"},
+            ]
+        }
+
+        with self.assertRaises(SchemaError) as ctx:
+            load_model(model, PACKAGE_BASE)
+
+        errors = ctx.exception.errors
+        self.assertEqual(len(errors), 5)
+        self.assertIn("Cliente.fields[0]", errors[0])
+        self.assertIn("não suportado", errors[0])
+        self.assertIn("Cliente.fields[1]", errors[1])
+        self.assertIn("duplicada", errors[2])
+        self.assertIn("entities[2]", errors[3])
+        self.assertIn("Vazio", errors[4])
+
+    def test_load_model_entity_options(self):
+        """Testa opções de entidade com padrões e validação"""
+        model = self.get_model()
+        model["entities"][0]["options"] = {"pagination": "unbounded"}
+
+        cliente, pedido = load_model(model, PACKAGE_BASE)
+
+        self.assertEqual(cliente["options"]["pagination"], "unbounded")
+        self.assertEqual(pedido["options"], ENTITY_OPTIONS)
+
+        model["entities"][0]["options"] = {"pagination": "infinita"}
+        model["entities"][1]["options"] = {"max_page_size": 0, "paginacao": "x"}
+        with self.assertRaises(SchemaError) as ctx:
+            load_model(model, PACKAGE_BASE)
+
+        errors = ctx.exception.errors
+        self.assertEqual(len(errors), 2)
+        self.assertIn("Cliente.options: pagination 'infinita'", errors[0])
+        self.assertIn("Pedido.options: opção 'paginacao' desconhecida", errors[1])
+
+    def test_load_model_projections_option(self):
+        """Testa que projeções exigem booleano e entidade sem coleções"""
+        model = self.get_model()
+        model["entities"][1]["options"] = {"projections": True}
+        pedido = load_model(model, PACKAGE_BASE)[1]
+        self.assertTrue(pedido["options"]["projections"])
+
+        model["entities"][0]["options"] = {"projections": True}
+        model["entities"][1]["options"] = {"projections": "sim"}
+        with self.assertRaises(SchemaError) as ctx:
+            load_model(model, PACKAGE_BASE)
+
+        errors = ctx.exception.errors
+        self.assertEqual(len(errors), 2)
+        self.assertIn(
+            "Cliente.options: projections não suporta coleções (pedidos)", errors[0]
+        )
+        self.assertIn(
+            "Pedido.options: projections precisa ser true ou false", errors[1]
+        )
+
+    def test_load_model_searchable_fields(self):
+        """Testa a opção searchable nos formatos texto e dicionário"""
+        model = self.get_model()
+        model["entities"][0]["fields"] = [
+            "nome:String:100:searchable",
+            "idade:Integer::positive,searchable",
+            {"name": "email", "type": "String", "searchable": True},
+        ]
+        fields = load_model(model, PACKAGE_BASE)[0]["fields"]
+        self.assertTrue(all(field["searchable"] for field in fields))
+        self.assertTrue(fields[1]["positive"])
+
+        model["entities"][0]["fields"] = ["nome:String:100:indexed"]
+        with self.assertRaises(SchemaError) as ctx:
+            load_model(model, PACKAGE_BASE)
+        self.assertIn("opção de campo 'indexed' não suportada", ctx.exception.errors[0])
+
+    def test_load_model_index_flags(self):
+        """Testa index e index=grupo nos campos e a opção migration"""
+        model = self.get_model()
+        model["entities"][0]["fields"] = [
+            "nome:String:100:index",
+            "email:String:255:searchable,index=contato",
+        ]
+        fields = load_model(model, PACKAGE_BASE)[0]["fields"]
+        self.assertIs(fields[0]["index"], True)
+        self.assertEqual(fields[1]["index"], "contato")
+
+        model["entities"][0]["fields"] = ["nome:String:100:positive=sim"]
+        model["entities"][1]["options"] = {"migration": "liquibase"}
+        with self.assertRaises(SchemaError) as ctx:
+            load_model(model, PACKAGE_BASE)
+        errors = ctx.exception.errors
+        self.assertIn("opção de campo 'positive=sim' não suportada", errors[0])
+        self.assertIn("migration 'liquibase' não suportado", errors[1])
+
+    def test_load_model_from_json_file(self):
+        """Testa leitura de arquivo JSON"""
+        path = os.path.join(self.temp_dir, "modelo.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.get_model(), f)
+
+        contexts = load_model(path, PACKAGE_BASE)
+
+        self.assertEqual([c["entity_name"] for c in contexts], ["Cliente", "Pedido"])
+
+    def test_load_model_from_yaml_file(self):
+        """Testa leitura de arquivo YAML"""
+        try:
+            import yaml
+        except ImportError:
+            self.skipTest("PyYAML não instalado")
+
+        path = os.path.join(self.temp_dir, "modelo.yaml")
+        with open(path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(self.get_model(), f)
+
+        contexts = load_model(path, PACKAGE_BASE)
+
+        self.assertEqual(len(contexts), 2)
+        self.assertEqual(contexts[0]["fields"][1]["name"], "email")
+
+    def test_load_model_malformed_files(self):
+        """Testa que JSON/YAML malformado vira SchemaError com o nome do arquivo"""
+        path = os.path.join(self.temp_dir, "modelo.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"entities": [')
+        with self.assertRaises(SchemaError) as ctx:
+            load_model(path, PACKAGE_BASE)
+        self.assertIn(f"{path}: JSON inválido", ctx.exception.errors[0])
+
+        try:
+            import yaml  # noqa: F401
+        except ImportError:
+            self.skipTest("PyYAML não instalado")
+        path = os.path.join(self.temp_dir, "modelo.yaml")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("entities: [Cliente\n  - : :")
+        with self.assertRaises(SchemaError) as ctx:
+            load_model(path, PACKAGE_BASE)
+        self.assertIn(f"{path}: YAML inválido", ctx.exception.errors[0])
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            exit_code = cli(["--schema", path, "--output", self.temp_dir])
+        self.assertEqual(exit_code, 1)
+        self.assertIn("❌ Erro ao carregar o modelo", stdout.getvalue())
+        self.assertIn("YAML inválido", stdout.getvalue())
+
+    def test_load_model_field_length(self):
+        """Testa que length de campo em dicionário precisa ser inteiro positivo"""
+        model = self.get_model()
+        model["entities"][0]["fields"] = [
+            {"name": "nome", "type": "String", "length": 80},
+            {"name": "email", "type": "String", "length": "255"},
+            {"name": "apelido", "type": "String", "length": 0},
+        ]
+        with self.assertRaises(SchemaError) as ctx:
+            load_model(model, PACKAGE_BASE)
+
+        errors = ctx.exception.errors
+        self.assertEqual(len(errors), 2)
+        self.assertIn("Cliente.fields[1]", errors[0])
+        self.assertIn("length precisa ser um inteiro positivo: '255'", errors[0])
+        self.assertIn("Cliente.fields[2]", errors[1])
+
+
+class TestModelIndex(BaseTestCase):
+    """Testes para a validação dos relacionamentos entre entidades"""
+
+    def load_errors(self, entities):
+        with self.assertRaises(SchemaError) as ctx:
+            load_model({"entities": entities}, PACKAGE_BASE)
+        return ctx.exception.errors
+
+    def test_index_resolves_both_sides(self):
+        """Testa que os dois lados de um OneToMany/ManyToOne são resolvidos"""
+        contexts = load_model(TestSchemaLoading.get_model(self), PACKAGE_BASE)
+        index = ModelIndex(contexts)
+
+        self.assertEqual(index.errors, [])
+        self.assertEqual(index.inverse_of("Cliente", "pedidos")["type"], "ManyToOne")
+        self.assertEqual(index.inverse_of("Pedido", "cliente")["name"], "pedidos")
+        self.assertEqual(index.field("Pedido", "total")["type"], "BigDecimal")
+        self.assertEqual(
+            [(name, rel["name"]) for name, rel in index.relationships_to("Cliente")],
+            [("Pedido", "cliente")],
+        )
+        self.assertEqual(contexts[0]["relationships"][0]["inverse_accessor"], "Cliente")
+
+    def test_unknown_target(self):
+        """Testa relacionamento para entidade que não existe no modelo"""
+        errors = self.load_errors(
+            [{"name": "Pedido", "relationships": ["cliente:ManyToOne:Cliente"]}]
+        )
+
+        self.assertEqual(
+            errors, ["Pedido.cliente: entidade alvo 'Cliente' não existe no modelo"]
+        )
+
+    def test_missing_mapped_by(self):
+        """Testa mappedBy sem o campo correspondente na entidade alvo"""
+        errors = self.load_errors(
+            [
+                {
+                    "name": "Cliente",
+                    "relationships": ["pedidos:OneToMany:Pedido:dono"],
+                },
+                {"name": "Pedido", "relationships": ["cliente:ManyToOne:Cliente"]},
+            ]
+        )
+
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Cliente.pedidos: 'dono' não existe em Pedido", errors[0])
+
+    def test_mapped_by_with_wrong_type(self):
+        """Testa mappedBy apontando para um relacionamento incompatível"""
+        errors = self.load_errors(
+            [
+                {"name": "Cliente", "relationships": ["pedidos:OneToMany:Pedido"]},
+                {"name": "Pedido", "relationships": ["cliente:OneToOne:Cliente"]},
+            ]
+        )
+
+        self.assertEqual(
+            errors,
+            [
+                "Cliente.pedidos: Pedido.cliente é OneToOne -> Cliente, "
+                "esperado ManyToOne -> Cliente"
+            ],
+        )
+
+    def test_many_to_many_inverse_field(self):
+        """Testa que inverse_field precisa existir como ManyToMany no alvo"""
+        entities = [
+            {
+                "name": "Produto",
+                "fields": ["nome:String"],
+                "relationships": [
+                    "categorias:ManyToMany:Categoria::inverse_field=Produtos"
+                ],
+            },
+            {
+                "name": "Categoria",
+                "fields": ["nome:String"],
+                "relationships": ["itens:ManyToMany:Produto::inverse_field=Categorias"],
+            },
+        ]
+
+        errors = self.load_errors(entities)
+        self.assertEqual(len(errors), 1)
+        self.assertIn(
+            "Produto.categorias: 'produtos' não existe em Categoria", errors[0]
+        )
+
+        entities[1]["relationships"] = [
+            "produtos:ManyToMany:Produto::inverse_field=categorias"
+        ]
+        contexts = load_model({"entities": entities}, PACKAGE_BASE)
+        content = self.render_template_to_string("entity.java.j2", contexts[0])
+        self.assertIn("categoria.getProdutos().add(this);", content)
+
+    def test_resolved_back_reference_setter(self):
+        """Testa que o helper do OneToMany usa o nome real do lado inverso"""
+        contexts = load_model(
+            {
+                "entities": [
+                    {
+                        "name": "Cliente",
+                        "relationships": ["pedidos:OneToMany:Pedido:comprador"],
+                    },
+                    {
+                        "name": "Pedido",
+                        "relationships": ["comprador:ManyToOne:Cliente"],
+                    },
+                ]
+            },
+            PACKAGE_BASE,
+        )
+
+        content = self.render_template_to_string("entity.java.j2", contexts[0])
+
+        self.assertIn('mappedBy="comprador"', content)
+        self.assertIn("pedido.setComprador(this);", content)
+
+
+class TestBatchGeneration(BaseTestCase):
+    """Testes para geração em lote a partir do modelo"""
+
+    def test_generate_model_all_entities(self):
+        """Testa geração de todos os arquivos de todas as entidades"""
+        contexts = load_model(TestSchemaLoading.get_model(self), PACKAGE_BASE)
+
+        report = generate_model(contexts, self.temp_dir, workers=1)
+
+        self.assertEqual(report.errors, [])
+        self.assertEqual(len(report.generated), 18)
+        for entity_name in ("Cliente", "Pedido"):
+            for suffix in ("", "Service", "ControllerTest"):
+                path = os.path.join(
+                    self.temp_dir, entity_name, f"{entity_name}{suffix}.java"
+                )
+                self.assertTrue(os.path.isfile(path), path)
+
+    def test_generate_model_application_properties(self):
+        """Testa as configurações de JDBC batching geradas para o modelo"""
+        model = TestSchemaLoading.get_model(self)
+        model["entities"][1]["options"] = {"id_strategy": "sequence"}
+        contexts = load_model(model, PACKAGE_BASE)
+
+        report = generate_model(contexts, self.temp_dir, workers=1)
+
+        self.assertEqual(report.errors, [])
+        self.assertEqual(len(report.generated), 19)
+        with open(
+            os.path.join(self.temp_dir, "application.properties"), encoding="utf-8"
+        ) as f:
+            content = f.read()
+        self.assertIn(
+            f"spring.jpa.properties.hibernate.jdbc.batch_size={JDBC_BATCH_SIZE}",
+            content,
+        )
+        self.assertIn("spring.jpa.properties.hibernate.order_inserts=true", content)
+        self.assertIn("PEDIDO_SEQ: INCREMENT BY 50 (Pedido)", content)
+        self.assertIn("#   Cliente", content)
+
+        # Sem entidades que aproveitem o batching, o arquivo não é gerado
+        self.assertEqual(
+            model_artifacts(
+                load_model(TestSchemaLoading.get_model(self), PACKAGE_BASE)
+            ),
+            [],
+        )
+
+    def test_generate_model_cache_configuration(self):
+        """Testa a configuração dos caches gerada para entidades com cache"""
+        model = TestSchemaLoading.get_model(self)
+        model["entities"][0]["options"] = {"cache": True, "cache_max_size": 200}
+        contexts = load_model(model, PACKAGE_BASE)
+
+        names = [name for _, _, name in model_artifacts(contexts)]
+        self.assertEqual(names, ["application.properties", "application.conf"])
+
+        report = generate_model(contexts, self.temp_dir, workers=1)
+        self.assertEqual(report.errors, [])
+        with open(
+            os.path.join(self.temp_dir, "application.conf"), encoding="utf-8"
+        ) as f:
+            conf = f.read()
+        self.assertIn('"Cliente" {', conf)
+        self.assertIn(f'"{PACKAGE_BASE}.domain.Cliente" {{', conf)
+        self.assertIn("maximum.size = 200", conf)
+        self.assertIn("eager-expiration.after-write = 600s", conf)
+        self.assertNotIn("Pedido", conf)
+
+        with open(
+            os.path.join(self.temp_dir, "application.properties"), encoding="utf-8"
+        ) as f:
+            properties = f.read()
+        self.assertIn("hibernate.cache.use_second_level_cache=true", properties)
+        self.assertNotIn("GenerationType.IDENTITY", properties)
+
+    def test_generate_model_flyway_migrations(self):
+        """Testa uma migration por entidade, com as FKs na última das duas"""
+        model = TestSchemaLoading.get_model(self)
+        model["entities"][0]["fields"][0] = "nome:String:100:searchable"
+        for entity in model["entities"]:
+            entity["options"] = {"migration": "flyway"}
+        contexts = load_model(model, PACKAGE_BASE)
+
+        names = [name for _, _, name in model_artifacts(contexts)]
+        self.assertEqual(
+            names,
+            [
+                "db/migration/V1__create_tb_cliente.sql",
+                "db/migration/V2__create_pedido.sql",
+            ],
+        )
+
+        report = generate_model(contexts, self.temp_dir, workers=1)
+        self.assertEqual(report.errors, [])
+        migration_dir = os.path.join(self.temp_dir, "db", "migration")
+        with open(
+            os.path.join(migration_dir, "V1__create_tb_cliente.sql"), encoding="utf-8"
+        ) as f:
+            cliente = f.read()
+        with open(
+            os.path.join(migration_dir, "V2__create_pedido.sql"), encoding="utf-8"
+        ) as f:
+            pedido = f.read()
+
+        self.assertIn("CREATE TABLE TB_CLIENTE (", cliente)
+        self.assertIn("NOME VARCHAR(100) NOT NULL,", cliente)
+        self.assertIn("CREATE INDEX IDX_TB_CLIENTE_NOME ON TB_CLIENTE (NOME);", cliente)
+        self.assertNotIn("FOREIGN KEY", cliente)
+        self.assertIn("TOTAL NUMERIC(19, 2) NOT NULL,", pedido)
+        self.assertIn(
+            "CREATE INDEX IDX_PEDIDO_CLIENTE_ID ON PEDIDO (CLIENTE_ID);", pedido
+        )
+        self.assertIn(
+            "ALTER TABLE PEDIDO ADD CONSTRAINT FK_PEDIDO_CLIENTE_ID "
+            "FOREIGN KEY (CLIENTE_ID) REFERENCES TB_CLIENTE (ID);",
+            pedido,
+        )
+
+    def test_generate_model_async_configuration(self):
+        """Testa virtual threads e o executor do AsyncConfig por opção async"""
+        model = TestSchemaLoading.get_model(self)
+        model["entities"][0]["options"] = {"async": "virtual_threads"}
+        contexts = load_model(model, PACKAGE_BASE)
+
+        names = [name for _, _, name in model_artifacts(contexts)]
+        self.assertEqual(names, ["application.properties"])
+
+        model["entities"][1]["options"] = {"async": "completable_future"}
+        contexts = load_model(model, PACKAGE_BASE)
+        names = [name for _, _, name in model_artifacts(contexts)]
+        self.assertEqual(names, ["application.properties", "AsyncConfig.java"])
+
+        report = generate_model(contexts, self.temp_dir, workers=1)
+        self.assertEqual(report.errors, [])
+        with open(
+            os.path.join(self.temp_dir, "application.properties"), encoding="utf-8"
+        ) as f:
+            properties = f.read()
+        self.assertIn("spring.threads.virtual.enabled=true", properties)
+        self.assertIn(
+            f"spring.mvc.async.request-timeout={ASYNC_TIMEOUT_SECONDS}s", properties
+        )
+        with open(
+            os.path.join(self.temp_dir, "AsyncConfig.java"), encoding="utf-8"
+        ) as f:
+            config = f.read()
+        self.assertIn(f"package {PACKAGE_BASE}.config;", config)
+        self.assertIn(f"executor.setMaxPoolSize({ASYNC_POOL_SIZE});", config)
+        self.assertIn(f"executor.setQueueCapacity({ASYNC_QUEUE_CAPACITY});", config)
+        self.assertIn("(Pedido)", config)
+
+    def test_parallel_generation_is_deterministic(self):
+        """Testa que o pool de processos gera exatamente a saída serial"""
+        contexts = load_model(TestSchemaLoading.get_model(self), PACKAGE_BASE)
+        serial_dir = os.path.join(self.temp_dir, "serial")
+        parallel_dir = os.path.join(self.temp_dir, "parallel")
+
+        serial = generate_model(contexts, serial_dir, workers=1).generated
+        report = generate_model(contexts, parallel_dir, workers=2)
+        parallel = report.generated
+
+        self.assertEqual(report.errors, [])
+        self.assertEqual(
+            [os.path.relpath(p, serial_dir) for p in serial],
+            [os.path.relpath(p, parallel_dir) for p in parallel],
+        )
+        for serial_path, parallel_path in zip(serial, parallel):
+            with open(serial_path, encoding="utf-8") as a, open(
+                parallel_path, encoding="utf-8"
+            ) as b:
+                self.assertEqual(a.read(), b.read())
+
+    def test_generation_errors_are_aggregated(self):
+        """Testa que uma falha não interrompe os demais arquivos"""
+        contexts = load_model(TestSchemaLoading.get_model(self), PACKAGE_BASE)
+        templates = [("inexistente.java.j2", "{entity_name}X.java")] + TEMPLATES
+
+        with patch("main.TEMPLATES", templates):
+            report = generate_model(contexts, self.temp_dir, workers=2)
+
+        errors = report.errors
+        self.assertEqual(len(report.generated), 18)
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(errors[0][0].endswith("ClienteX.java"))
+        self.assertIn("TemplateNotFound", errors[0][1])
+        self.assertTrue(errors[1][0].endswith("PedidoX.java"))
+
+    def test_cli_schema_mode(self):
+        """Testa o modo --schema sem nenhum input()"""
+        path = os.path.join(self.temp_dir, "modelo.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(TestSchemaLoading.get_model(self), f)
+        output = os.path.join(self.temp_dir, "out")
+
+        with patch("builtins.input") as mock_input:
+            exit_code = cli(["--schema", path, "--output", output])
+
+        self.assertEqual(exit_code, 0)
+        mock_input.assert_not_called()
+        self.assertTrue(os.path.isfile(os.path.join(output, "Pedido", "Pedido.java")))
+
+    def test_cli_schema_mode_invalid_model(self):
+        """Testa que modelo inválido não gera nada e retorna erro"""
+        path = os.path.join(self.temp_dir, "modelo.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"entities": [{"name": "X", "fields": ["a:Texto"]}]}, f)
+        output = os.path.join(self.temp_dir, "out")
+
+        exit_code = cli(["--schema", path, "--output", output])
+
+        self.assertEqual(exit_code, 1)
+        self.assertFalse(os.path.exists(output))
+
+
+class TestIncrementalGeneration(BaseTestCase):
+    """Testes para a regeneração incremental guiada pelo manifest"""
+
+    def setUp(self):
+        super().setUp()
+        self.model = TestSchemaLoading.get_model(self)
+        self.output = os.path.join(self.temp_dir, "out")
+
+    def generate(self, force=False):
+        manifest = Manifest.load(self.output, force)
+        contexts = load_model(self.model, PACKAGE_BASE)
+        return generate_model(contexts, self.output, workers=1, manifest=manifest)
+
+    def test_unchanged_model_is_skipped(self):
+        """Testa que uma segunda execução não renderiza nem reescreve nada"""
+        first = self.generate()
+        entity_file = os.path.join(self.output, "Cliente", "Cliente.java")
+        mtime = os.stat(entity_file).st_mtime_ns
+
+        second = self.generate()
+
+        self.assertEqual(len(first.generated), 18)
+        self.assertEqual(second.generated, [])
+        self.assertEqual(len(second.skipped), 18)
+        self.assertEqual(os.stat(entity_file).st_mtime_ns, mtime)
+        self.assertTrue(os.path.isfile(os.path.join(self.output, MANIFEST_FILE)))
+
+    def test_application_properties_follows_the_model(self):
+        """Testa que o arquivo do modelo é pulado, regenerado e removido"""
+        self.model["entities"][0]["options"] = {"bulk": True}
+        properties = os.path.join(self.output, "application.properties")
+
+        self.assertIn(properties, self.generate().generated)
+        self.assertIn(properties, self.generate().skipped)
+
+        # Another entity's options change the shared file
+        self.model["entities"][1]["options"] = {"id_strategy": "sequence"}
+        self.assertIn(properties, self.generate().written)
+
+        del self.model["entities"][0]["options"]
+        del self.model["entities"][1]["options"]
+        report = self.generate()
+        self.assertIn(properties, report.removed)
+        self.assertFalse(os.path.exists(properties))
+
+    def test_only_changed_entity_is_regenerated(self):
+        """Testa que apenas a entidade alterada é regenerada"""
+        self.generate()
+        self.model["entities"][1]["fields"].append("numero:String:20")
+
+        report = self.generate()
+
+        self.assertEqual(len(report.generated), 9)
+        self.assertTrue(all("/Pedido/" in path for path in report.generated))
+        with open(os.path.join(self.output, "Pedido", "Pedido.java")) as f:
+            self.assertIn("private String numero;", f.read())
+
+    def test_changed_template_regenerates_its_artifacts(self):
+        """Testa que mudar o hash de um template regenera só os arquivos dele"""
+        self.generate()
+
+        original = manifest_module.hash_template
+        with patch(
+            "manifest.hash_template",
+            lambda name: "x" if name == "mapper.java.j2" else original(name),
+        ):
+            report = self.generate()
+
+        self.assertEqual(len(report.generated), 2)
+        self.assertTrue(all(p.endswith("Mapper.java") for p in report.generated))
+
+    def test_template_hash_covers_imported_templates(self):
+        """Testa que mudar um template importado (ex: _indexes.j2) muda o hash"""
+        template_dir = os.path.join(self.temp_dir, "templates")
+        os.makedirs(template_dir)
+        with open(os.path.join(template_dir, "entity.java.j2"), "w") as f:
+            f.write('{% import "_indexes.j2" as table_indexes with context %}x')
+        with open(os.path.join(template_dir, "_indexes.j2"), "w") as f:
+            f.write("{% set indexes = [] %}")
+        before = manifest_module.hash_template("entity.java.j2", template_dir)
+
+        with open(os.path.join(template_dir, "_indexes.j2"), "a") as f:
+            f.write("{# novo índice #}")
+
+        self.assertNotEqual(
+            manifest_module.hash_template("entity.java.j2", template_dir), before
+        )
+
+    def test_edited_or_deleted_output_is_regenerated(self):
+        """Testa que arquivos apagados ou editados à mão são regenerados"""
+        self.generate()
+        os.remove(os.path.join(self.output, "Cliente", "ClienteService.java"))
+        with open(os.path.join(self.output, "Pedido", "Pedido.java"), "a") as f:
+            f.write("// editado")
+
+        report = self.generate()
+
+        self.assertEqual(len(report.generated), 2)
+
+    def test_rendered_but_identical_files_are_unchanged(self):
+        """Testa que force renderiza tudo mas não reescreve arquivos idênticos"""
+        self.generate()
+
+        report = self.generate(force=True)
+
+        self.assertEqual(report.written, [])
+        self.assertEqual(len(report.unchanged), 18)
+
+    def test_removed_entity_files_are_deleted(self):
+        """Testa que arquivos de entidades retiradas do modelo são removidos"""
+        self.model["entities"].append(
+            {"name": "Produto", "fields": ["preco:BigDecimal::positive"]}
+        )
+        self.generate()
+        del self.model["entities"][2]
+
+        report = self.generate()
+
+        self.assertEqual(len(report.removed), 9)
+        self.assertEqual(len(report.skipped), 18)
+        self.assertFalse(os.path.exists(os.path.join(self.output, "Produto")))
+        self.assertIn("9 removidos", report.summary())
+
+    def test_force_regenerates_everything(self):
+        """Testa que force ignora o manifest anterior"""
+        self.generate()
+
+        report = self.generate(force=True)
+
+        self.assertEqual(len(report.generated), 18)
+        self.assertEqual(len(self.generate().skipped), 18)
+
+    def test_force_still_deletes_removed_entity_files(self):
+        """Testa que force não esquece os arquivos de entidades retiradas"""
+        self.model["entities"].append(
+            {"name": "Produto", "fields": ["preco:BigDecimal::positive"]}
+        )
+        self.generate()
+        del self.model["entities"][2]
+
+        report = self.generate(force=True)
+
+        self.assertEqual(len(report.removed), 9)
+        self.assertEqual(len(report.generated), 18)
+        self.assertFalse(os.path.exists(os.path.join(self.output, "Produto")))
+
+    def test_generated_migrations_are_not_rewritten(self):
+        """Testa que uma migration já gerada não é reescrita nem apagada"""
+        for entity in self.model["entities"]:
+            entity["options"] = {"migration": "flyway"}
+        self.generate()
+        migration = os.path.join(
+            self.output, "db", "migration", "V2__create_pedido.sql"
+        )
+        with open(migration, encoding="utf-8") as f:
+            applied = f.read()
+
+        self.model["entities"][1]["fields"].append("numero:String:20")
+        report = self.generate()
+
+        self.assertEqual(len(report.errors), 1)
+        self.assertEqual(report.errors[0][0], migration)
+        self.assertIn("migration nova", report.errors[0][1])
+        self.assertEqual(len(self.generate().errors), 1)
+        with open(migration, encoding="utf-8") as f:
+            self.assertEqual(f.read(), applied)
+
+        # Removing the entity keeps the script Flyway may have applied
+        del self.model["entities"][1]
+        del self.model["entities"][0]["relationships"]
+        report = self.generate()
+        self.assertNotIn(migration, report.removed)
+        self.assertTrue(os.path.isfile(migration))
+
+    def test_force_rewrites_generated_migrations(self):
+        """Testa que force reescreve uma migration ainda não aplicada"""
+        for entity in self.model["entities"]:
+            entity["options"] = {"migration": "flyway"}
+        self.generate()
+        self.model["entities"][1]["fields"].append("numero:String:20")
+
+        report = self.generate(force=True)
+
+        self.assertEqual(report.errors, [])
+        migration = os.path.join(
+            self.output, "db", "migration", "V2__create_pedido.sql"
+        )
+        with open(migration, encoding="utf-8") as f:
+            self.assertIn("NUMERO VARCHAR(20)", f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,10 @@ from unittest.mock import patch, MagicMock
 # Import modules to test
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from main import main, render_template
+from main import TEMPLATES, create_environment, main, render_template
 from tests.test_base import BaseTestCase
+from writer import remove_output, write_if_changed
+import writer
 
 
 class TestIntegration(BaseTestCase):
@@ -186,13 +188,84 @@ class TestIntegration(BaseTestCase):
         self.assertTrue(os.path.isfile(output_path))
 
 
+class TestTemplateCache(BaseTestCase):
+    """Testes para o cache de templates compilados"""
+
+    def test_bytecode_cache_is_persisted(self):
+        """Testa que os templates compilados são gravados no diretório de cache"""
+        cache_dir = os.path.join(self.temp_dir, "cache")
+        cold_env = create_environment(cache_dir)
+
+        for template_name, _ in TEMPLATES:
+            cold_env.get_template(template_name)
+
+        self.assertEqual(len(os.listdir(cache_dir)), len(TEMPLATES))
+
+    def test_warm_cache_renders_same_output(self):
+        """Testa que um template carregado do cache gera a mesma saída"""
+        cache_dir = os.path.join(self.temp_dir, "cache")
+        context = self.get_relationship_context()
+        cold = create_environment(cache_dir).get_template("entity.java.j2")
+        warm = create_environment(cache_dir).get_template("entity.java.j2")
+        uncached = create_environment(None).get_template("entity.java.j2")
+
+        self.assertEqual(cold.render(context), warm.render(context))
+        self.assertEqual(uncached.render(context), warm.render(context))
+
+
+class TestOutputWriter(BaseTestCase):
+    """Testes para a escrita atômica e condicional dos arquivos gerados"""
+
+    def test_identical_content_is_not_rewritten(self):
+        """Testa que conteúdo idêntico não altera o arquivo nem o mtime"""
+        path = os.path.join(self.temp_dir, "Cliente", "Cliente.java")
+
+        self.assertTrue(write_if_changed(path, "class Cliente {}"))
+        os.utime(path, ns=(1, 1))
+        self.assertFalse(write_if_changed(path, "class Cliente {}"))
+
+        self.assertEqual(os.stat(path).st_mtime_ns, 1)
+
+    def test_changed_content_replaces_file_without_temp_leftovers(self):
+        """Testa substituição atômica sem deixar arquivos temporários"""
+        path = os.path.join(self.temp_dir, "Cliente.java")
+        write_if_changed(path, "v1")
+
+        self.assertTrue(write_if_changed(path, "v2 ç"))
+
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "v2 ç")
+        self.assertEqual(os.listdir(self.temp_dir), ["Cliente.java"])
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o666 & ~writer._UMASK)
+
+    def test_failed_write_keeps_previous_file(self):
+        """Testa que uma falha durante a escrita preserva o arquivo anterior"""
+        path = os.path.join(self.temp_dir, "Cliente.java")
+        write_if_changed(path, "original")
+
+        with patch("writer.os.replace", side_effect=OSError("disco cheio")):
+            with self.assertRaises(OSError):
+                write_if_changed(path, "novo")
+
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "original")
+        self.assertEqual(os.listdir(self.temp_dir), ["Cliente.java"])
+
+    def test_remove_output_prunes_empty_directory(self):
+        """Testa remoção de arquivo e do diretório da entidade vazio"""
+        path = os.path.join(self.temp_dir, "Cliente", "Cliente.java")
+        write_if_changed(path, "x")
+
+        self.assertTrue(remove_output(path))
+        self.assertFalse(os.path.exists(os.path.dirname(path)))
+        self.assertFalse(remove_output(path))
+
+
 class TestPerformance(BaseTestCase):
-    """Testes de performance básicos"""
+    """Testes de entidades grandes (tempos medidos em benchmarks/run_benchmarks.py)"""
 
     def test_large_entity_generation(self):
         """Testa geração de entidade com muitos campos"""
-        import time
-
         # Criar entidade com 50 campos
         fields = []
         for i in range(50):
@@ -208,12 +281,7 @@ class TestPerformance(BaseTestCase):
             "relationships": [],
         }
 
-        start_time = time.time()
         result = self.render_template_to_string("entity.java.j2", context)
-        end_time = time.time()
-
-        # Deve gerar em menos de 1 segundo
-        self.assertLess(end_time - start_time, 1.0)
 
         # Verificar se todos os campos foram gerados
         for i in range(50):
@@ -221,8 +289,6 @@ class TestPerformance(BaseTestCase):
 
     def test_multiple_relationships_performance(self):
         """Testa geração com muitos relacionamentos"""
-        import time
-
         # Criar 20 relacionamentos
         relationships = []
         for i in range(20):
@@ -245,12 +311,7 @@ class TestPerformance(BaseTestCase):
             "relationships": relationships,
         }
 
-        start_time = time.time()
         result = self.render_template_to_string("entity.java.j2", context)
-        end_time = time.time()
-
-        # Deve gerar em menos de 2 segundos
-        self.assertLess(end_time - start_time, 2.0)
 
         # Verificar relacionamentos
         for i in range(20):
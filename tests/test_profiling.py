@@ -0,0 +1,115 @@
+import unittest
+import io
+import json
+import os
+import sys
+from unittest.mock import patch
+
+# Import modules to test
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import TEMPLATES, cli, generate_model, render_template
+from manifest import Manifest
+from profiling import PHASES, Profiler
+from sinks import MemorySink
+from tests.test_base import BaseTestCase
+
+
+class TestProfiling(BaseTestCase):
+    """Testes para a instrumentação de tempos da geração"""
+
+    def write_model(self):
+        path = os.path.join(self.temp_dir, "modelo.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"entities": [{"name": "Cliente", "fields": ["nome:String"]}]}, f)
+        return path
+
+    def test_generate_model_records_phases_and_templates(self):
+        """Testa tempos por fase e por template na geração"""
+        profiler = Profiler()
+
+        generate_model(
+            [self.get_basic_context(), self.get_relationship_context()],
+            workers=1,
+            sink=MemorySink(),
+            profiler=profiler,
+        )
+
+        # No manifest, no manifest phase
+        self.assertEqual(set(profiler.phases), {"compile", "render", "write"})
+        self.assertEqual(len(profiler.templates), len(TEMPLATES))
+        self.assertTrue(all(s["count"] == 2 for s in profiler.templates.values()))
+
+        profiler = Profiler()
+        with patch("builtins.print"):
+            generate_model(
+                [self.get_basic_context()],
+                self.temp_dir,
+                workers=1,
+                manifest=Manifest.load(self.temp_dir),
+                profiler=profiler,
+            )
+        self.assertEqual(
+            set(profiler.phases), {"manifest", "compile", "render", "write"}
+        )
+
+    def test_render_template_records_phases(self):
+        """Testa a instrumentação de render_template"""
+        profiler = Profiler()
+        output_path = os.path.join(self.temp_dir, "Cliente.java")
+
+        with patch("builtins.print"):
+            render_template(
+                "entity.java.j2", self.get_basic_context(), output_path, profiler
+            )
+
+        self.assertEqual(list(profiler.to_dict()["phases_ms"]), PHASES[2:])
+
+    def test_cli_profile_outputs(self):
+        """Testa --profile, --profile-json e --cprofile"""
+        schema = self.write_model()
+        json_path = os.path.join(self.temp_dir, "tempos.json")
+        cprofile_path = os.path.join(self.temp_dir, "perfil.prof")
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            exit_code = cli(
+                [
+                    "--schema",
+                    schema,
+                    "--output",
+                    os.path.join(self.temp_dir, "out"),
+                    "--workers",
+                    "1",
+                    "--profile",
+                    "--profile-json",
+                    json_path,
+                    "--cprofile",
+                    cprofile_path,
+                ]
+            )
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Tempos por fase", stdout.getvalue())
+        self.assertIn("entity.java.j2", stdout.getvalue())
+        with open(json_path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(list(data["phases_ms"]), PHASES)
+        self.assertEqual(data["templates"]["service.java.j2"]["count"], 1)
+        self.assertGreater(data["total_ms"], 0)
+        self.assertTrue(os.path.getsize(cprofile_path) > 0)
+
+    def test_cli_profile_with_stdout_goes_to_stderr(self):
+        """Testa que a tabela de tempos não se mistura ao código em --stdout"""
+        schema = self.write_model()
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout, patch(
+            "sys.stderr", new_callable=io.StringIO
+        ) as stderr:
+            cli(["--schema", schema, "--stdout", "--workers", "1", "--profile"])
+
+        self.assertNotIn("Tempos por fase", stdout.getvalue())
+        self.assertIn("Tempos por fase", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -84,9 +84,14 @@ class TestRelationships(BaseTestCase):
         self.assertIn("request.clienteId()", result)
         self.assertIn("request.itensIds()", result)
 
-        # Verificar busca de entidades relacionadas
-        self.assertIn("clienteRepository.findById", result)
-        self.assertIn("itempedidoRepository.findAllById", result)
+        # Alvos carregados (com "não foi encontrado"); coleções em uma única consulta
+        self.assertIn("clienteRepository.findById(request.clienteId())", result)
+        self.assertIn(
+            'new RuntimeException("Cliente com ID \'" + request.clienteId()', result
+        )
+        self.assertNotIn("getReferenceById", result)
+        self.assertIn("itempedidoRepository.findAllById(ids)", result)
+        self.assertIn("itens.forEach(entity::addItemPedido);", result)
 
     def test_mapper_with_relationships(self):
         """Testa Mapper com relacionamentos"""
@@ -105,6 +110,78 @@ class TestRelationships(BaseTestCase):
         self.assertIn("default ClienteSummaryResponse clienteToClienteSummary", result)
         self.assertIn("default List<ItemPedidoSummaryResponse>", result)
 
+    def test_repository_entity_graph_for_to_one(self):
+        """Testa que as leituras carregam associações *ToOne com @EntityGraph"""
+        context = self.get_relationship_context()
+        result = self.render_template_to_string("repository.java.j2", context)
+
+        self.assertEqual(
+            result.count('@EntityGraph(attributePaths = { "cliente" })'), 2
+        )
+        self.assertIn("Optional<Pedido> findWithRelationshipsById(Long id);", result)
+        self.assertIn("Page<Pedido> findAll(Pageable pageable);", result)
+
+        # Coleções ficam fora do grafo (fetch join + paginação = paginação em memória)
+        self.assertNotIn('"itens"', result)
+
+    def test_service_find_response_uses_entity_graph(self):
+        """Testa que a busca por ID da resposta usa o método com @EntityGraph"""
+        context = self.get_relationship_context()
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn("repository.findWithRelationshipsById(id)", result)
+
+    def test_entity_collections_batch_size(self):
+        """Testa @BatchSize nas coleções para carregar N coleções em poucas queries"""
+        context = self.get_relationship_context()
+        context["options"] = {"fetch_batch_size": 50}
+        result = self.render_template_to_string("entity.java.j2", context)
+
+        self.assertIn("import org.hibernate.annotations.BatchSize;", result)
+        self.assertIn("@BatchSize(size = 50)", result)
+
+    def test_export_csv_includes_to_one_ids(self):
+        """Testa a exportação com o ID das associações *ToOne no CSV"""
+        context = self.get_relationship_context()
+        context["options"] = {"export": True}
+
+        controller = self.render_template_to_string("controller.java.j2", context)
+        self.assertIn('CSV_HEADER = "id,numero,clienteId";', controller)
+        self.assertIn(
+            "csv(response.cliente() == null ? null : response.cliente().id())",
+            controller,
+        )
+
+        repository = self.render_template_to_string("repository.java.j2", context)
+        graph = repository.index("Stream<Pedido> streamAllByOrderByIdAsc();")
+        self.assertIn(
+            '@EntityGraph(attributePaths = { "cliente" })', repository[:graph]
+        )
+
+    def test_projections_summary_views(self):
+        """Testa projeções aninhadas para as associações *ToOne"""
+        context = self.get_relationship_context()
+        context["relationships"] = context["relationships"][:1]
+        context["options"] = {"projections": True}
+
+        repository = self.render_template_to_string("repository.java.j2", context)
+        self.assertIn("ClienteSummaryView getCliente();", repository)
+        self.assertIn("interface ClienteSummaryView {", repository)
+        self.assertIn("Page<PedidoView> findAllViewsBy(Pageable pageable);", repository)
+
+        mapper = self.render_template_to_string("mapper.java.j2", context)
+        self.assertIn('qualifiedByName = "clienteViewToClienteSummary"', mapper)
+        self.assertIn(
+            "clienteViewToClienteSummary(PedidoRepository.ClienteSummaryView view)",
+            mapper,
+        )
+
+        # Coleções não cabem numa projeção: a entidade volta às leituras normais
+        context = self.get_relationship_context()
+        context["options"] = {"projections": True}
+        repository = self.render_template_to_string("repository.java.j2", context)
+        self.assertNotIn("PedidoView", repository)
+
 
 class TestRelationshipTypes(BaseTestCase):
     """Testes para diferentes tipos de relacionamentos"""
@@ -199,7 +276,27 @@ class TestRelationshipTypes(BaseTestCase):
         # Verificar uso de HashSet para ManyToMany
         self.assertIn("new java.util.HashSet<>", result)
         self.assertIn("request.categoriasIds()", result)
-        self.assertIn("categoriaRepository.findAllById", result)
+        # One SELECT ... IN for all IDs, with the missing-ID check
+        self.assertIn("categoriaRepository.findAllById(ids)", result)
+        self.assertIn("Alguns registros de Categoria não foram encontrados", result)
+        self.assertNotIn("categoriaRepository.getReferenceById", result)
+
+    def test_service_one_to_one_inverse_side_loads_entity(self):
+        """Testa que os dois lados do OneToOne carregam a entidade"""
+        context = self.get_basic_context()
+        context["relationships"] = [
+            {"name": "endereco", "type": "OneToOne", "target": "Endereco"},
+            {
+                "name": "perfil",
+                "type": "OneToOne",
+                "target": "Perfil",
+                "mapped_by": "cliente",
+            },
+        ]
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn("enderecoRepository.findById(request.enderecoId())", result)
+        self.assertIn("perfilRepository.findById(request.perfilId())", result)
 
 
 class TestRelationshipValidation(BaseTestCase):
@@ -0,0 +1,255 @@
+import unittest
+import io
+import json
+import os
+import sys
+import tarfile
+import zipfile
+from unittest.mock import patch
+
+# Import modules to test
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import cli, generate_model, render_entity
+from sinks import (
+    DirectorySink,
+    MemorySink,
+    StdoutSink,
+    TarSink,
+    ZipSink,
+    archive_format,
+    open_archive,
+)
+from tests.test_base import BaseTestCase
+
+
+class TestRenderEntity(BaseTestCase):
+    """Testes para a API de renderização em memória"""
+
+    def test_render_entity_returns_all_artifacts(self):
+        """Testa que todos os artefatos são devolvidos sem I/O de saída"""
+        context = self.get_relationship_context()
+
+        with patch("main.OUTPUT_DIR", self.temp_dir):
+            artifacts = render_entity(context)
+
+        self.assertEqual(os.listdir(self.temp_dir), [])
+        self.assertEqual(
+            list(artifacts),
+            [
+                "Pedido/Pedido.java",
+                "Pedido/PedidoRepository.java",
+                "Pedido/PedidoRequest.java",
+                "Pedido/PedidoResponse.java",
+                "Pedido/PedidoMapper.java",
+                "Pedido/PedidoService.java",
+                "Pedido/PedidoController.java",
+                "Pedido/PedidoServiceTest.java",
+                "Pedido/PedidoControllerTest.java",
+            ],
+        )
+        self.assertIn("public class Pedido {", artifacts["Pedido/Pedido.java"])
+        self.assertIn(
+            "public class PedidoService", artifacts["Pedido/PedidoService.java"]
+        )
+
+    def test_render_entity_matches_generated_files(self):
+        """Testa que a renderização em memória é idêntica aos arquivos gerados"""
+        context = self.get_basic_context()
+
+        generate_model([context], self.temp_dir, workers=1)
+
+        for name, content in render_entity(context).items():
+            with open(os.path.join(self.temp_dir, name), encoding="utf-8") as f:
+                self.assertEqual(f.read(), content)
+
+
+class TestSinks(BaseTestCase):
+    """Testes para os destinos dos artefatos gerados"""
+
+    def test_memory_sink(self):
+        """Testa geração completa sem tocar no disco"""
+        sink = MemorySink()
+
+        report = generate_model(
+            [self.get_basic_context(), self.get_bigdecimal_context()],
+            workers=1,
+            sink=sink,
+        )
+
+        self.assertEqual(report.errors, [])
+        self.assertEqual(len(sink.files), 18)
+        self.assertIn("Produto/ProdutoMapper.java", sink.files)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+        self.assertEqual(
+            sink.location("Produto/Produto.java"), "<memória>/Produto/Produto.java"
+        )
+
+    def test_directory_sink(self):
+        """Testa gravação e detecção de conteúdo inalterado"""
+        sink = DirectorySink(self.temp_dir)
+
+        self.assertTrue(sink.write("Cliente/Cliente.java", "x"))
+        self.assertFalse(sink.write("Cliente/Cliente.java", "x"))
+        self.assertEqual(
+            sink.location("Cliente/Cliente.java"),
+            f"{self.temp_dir}/Cliente/Cliente.java",
+        )
+
+    def test_stdout_sink(self):
+        """Testa escrita sequencial com cabeçalho por arquivo"""
+        stream = io.StringIO()
+
+        with StdoutSink(stream) as sink:
+            sink.write("Cliente/Cliente.java", "class Cliente {}")
+            sink.write("Cliente/ClienteService.java", "class ClienteService {}\n")
+
+        self.assertEqual(
+            stream.getvalue(),
+            "// ===== Cliente/Cliente.java =====\nclass Cliente {}\n"
+            "// ===== Cliente/ClienteService.java =====\nclass ClienteService {}\n",
+        )
+
+    def test_cli_stdout_requires_schema_without_archive(self):
+        """Testa que --stdout sem --schema ou com --archive é recusado"""
+        archive = os.path.join(self.temp_dir, "saida.zip")
+        for argv in (
+            ["--stdout"],
+            ["--schema", "modelo.json", "--stdout", "--archive", archive],
+        ):
+            with patch("sys.stderr", new_callable=io.StringIO) as stderr, patch(
+                "builtins.input"
+            ) as mock_input:
+                with self.assertRaises(SystemExit) as ctx:
+                    cli(argv)
+            self.assertEqual(ctx.exception.code, 2)
+            self.assertIn("--stdout", stderr.getvalue())
+            mock_input.assert_not_called()
+        self.assertFalse(os.path.exists(archive))
+
+    def test_cli_stdout_keeps_messages_out_of_stream(self):
+        """Testa que --stdout só escreve código na saída padrão"""
+        path = os.path.join(self.temp_dir, "modelo.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"entities": [{"name": "Cliente", "fields": ["nome:String"]}]}, f)
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout, patch(
+            "sys.stderr", new_callable=io.StringIO
+        ) as stderr:
+            exit_code = cli(["--schema", path, "--stdout", "--workers", "1"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(
+            stdout.getvalue().startswith("// ===== Cliente/Cliente.java =====")
+        )
+        self.assertEqual(stdout.getvalue().count("// ===== "), 9)
+        self.assertIn("entidades geradas", stderr.getvalue())
+        self.assertEqual(os.listdir(self.temp_dir), ["modelo.json"])
+
+
+class TestArchiveSinks(BaseTestCase):
+    """Testes para o empacotamento dos artefatos em zip/tar"""
+
+    def write_model(self):
+        path = os.path.join(self.temp_dir, "modelo.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"entities": [{"name": "Cliente", "fields": ["nome:String"]}]}, f)
+        return path
+
+    def test_zip_sink(self):
+        """Testa que o zip contém todos os artefatos renderizados"""
+        context = self.get_basic_context()
+        path = os.path.join(self.temp_dir, "saida.zip")
+
+        with ZipSink(path) as sink:
+            report = generate_model([context], workers=1, sink=sink)
+
+        self.assertEqual(report.errors, [])
+        self.assertEqual(report.generated[0], f"{path}:Cliente/Cliente.java")
+        self.assertEqual(os.listdir(self.temp_dir), ["saida.zip"])
+        with zipfile.ZipFile(path) as archive:
+            self.assertEqual(len(archive.namelist()), 9)
+            self.assertEqual(
+                archive.read("Cliente/ClienteService.java").decode("utf-8"),
+                render_entity(context)["Cliente/ClienteService.java"],
+            )
+
+    def test_tar_gz_sink(self):
+        """Testa que o tar.gz contém todos os artefatos renderizados"""
+        path = os.path.join(self.temp_dir, "saida.tar.gz")
+
+        with open_archive(path) as sink:
+            generate_model([self.get_relationship_context()], workers=1, sink=sink)
+
+        with tarfile.open(path) as archive:
+            self.assertEqual(len(archive.getnames()), 9)
+            self.assertIn("Pedido/PedidoMapper.java", archive.getnames())
+
+    def test_archive_is_deterministic(self):
+        """Testa que o mesmo modelo produz pacotes byte a byte idênticos"""
+        factories = {
+            "zip": ZipSink,
+            "tar": TarSink,
+            "tar.gz": lambda stream: TarSink(stream, "gz"),
+        }
+        for fmt, factory in factories.items():
+            contents = []
+            for _ in range(2):
+                stream = io.BytesIO()
+                with factory(stream) as sink:
+                    generate_model([self.get_basic_context()], workers=1, sink=sink)
+                contents.append(stream.getvalue())
+            self.assertEqual(contents[0], contents[1], fmt)
+
+    def test_abort_discards_partial_archive(self):
+        """Testa que uma falha não deixa pacote truncado nem temporários"""
+        path = os.path.join(self.temp_dir, "saida.zip")
+
+        with self.assertRaises(RuntimeError):
+            with ZipSink(path) as sink:
+                sink.write("Cliente/Cliente.java", "class Cliente {}")
+                raise RuntimeError("falha")
+
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_archive_format(self):
+        """Testa a dedução do formato pela extensão"""
+        self.assertEqual(archive_format("out.ZIP"), "zip")
+        self.assertEqual(archive_format("out.tgz"), "tar.gz")
+        self.assertEqual(archive_format("out.tar.gz"), "tar.gz")
+        self.assertEqual(archive_format("out.bin", "tar"), "tar")
+        with self.assertRaises(ValueError):
+            archive_format("out.bin")
+
+    def test_cli_archive(self):
+        """Testa --archive gerando o pacote sem diretório de saída"""
+        schema = self.write_model()
+        path = os.path.join(self.temp_dir, "saida.zip")
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            exit_code = cli(["--schema", schema, "--archive", path])
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("entidades geradas", stdout.getvalue())
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir)), ["modelo.json", "saida.zip"]
+        )
+        with zipfile.ZipFile(path) as archive:
+            self.assertIn("Cliente/ClienteController.java", archive.namelist())
+
+    def test_cli_archive_failure_keeps_no_file(self):
+        """Testa que um modelo inválido não publica pacote"""
+        schema = os.path.join(self.temp_dir, "modelo.json")
+        with open(schema, "w", encoding="utf-8") as f:
+            json.dump({"entities": [{"name": "cliente"}]}, f)
+        path = os.path.join(self.temp_dir, "saida.tar")
+
+        with patch("sys.stdout", new_callable=io.StringIO):
+            exit_code = cli(["--schema", schema, "--archive", path])
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(os.listdir(self.temp_dir), ["modelo.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
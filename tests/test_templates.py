@@ -12,6 +12,105 @@ from tests.test_base import BaseTestCase
 class TestEntityTemplate(BaseTestCase):
     """Testes para template entity.java.j2"""
 
+    def test_entity_second_level_cache(self):
+        """Testa o cache de segundo nível só com a opção cache"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("entity.java.j2", context)
+        self.assertNotIn("CacheConcurrencyStrategy", result)
+
+        context["options"] = {"cache": True}
+        result = self.render_template_to_string("entity.java.j2", context)
+        self.assertIn(
+            "@Cacheable\n@Cache(usage = CacheConcurrencyStrategy.READ_WRITE)", result
+        )
+
+    def test_entity_searchable_indexes(self):
+        """Testa os índices dos campos pesquisáveis no @Table"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("entity.java.j2", context)
+        self.assertIn('@Table(name="TB_CLIENTE")', result)
+        self.assertNotIn("@Index", result)
+
+        context["fields"][0]["searchable"] = True
+        result = self.render_template_to_string("entity.java.j2", context)
+        self.assertIn('@Table(name="TB_CLIENTE", indexes = {', result)
+        self.assertIn(
+            '@Index(name = "IDX_TB_CLIENTE_NOME", columnList = "NOME")', result
+        )
+        self.assertNotIn("IDX_TB_CLIENTE_EMAIL", result)
+
+    def test_entity_foreign_key_and_declared_indexes(self):
+        """Testa índices das FKs, da tabela de junção e dos grupos declarados"""
+        context = self.get_relationship_context()
+        context["fields"] = [
+            {"name": "status", "type": "String", "index": "status_data"},
+            {"name": "data", "type": "LocalDate", "index": "status_data"},
+            {"name": "numero", "type": "Long", "index": True},
+        ]
+        context["relationships"].append(
+            {"name": "tags", "type": "ManyToMany", "target": "Tag"}
+        )
+        result = self.render_template_to_string("entity.java.j2", context)
+
+        self.assertIn(
+            '@Index(name = "IDX_TB_PEDIDO_NUMERO", columnList = "NUMERO")', result
+        )
+        self.assertIn(
+            '@Index(name = "IDX_TB_PEDIDO_STATUS_DATA", columnList = "STATUS, DATA")',
+            result,
+        )
+        for rel in context["relationships"]:
+            if rel["type"] in ("ManyToOne", "OneToOne"):
+                column = f"{rel['name'].upper()}_ID"
+                self.assertIn(
+                    f'@Index(name = "IDX_TB_PEDIDO_{column}", columnList = "{column}")',
+                    result,
+                )
+        self.assertIn(
+            'indexes = @Index(name = "IDX_TB_PEDIDO_TAGS_TAG_ID", columnList = "TAG_ID"))',
+            result,
+        )
+
+    def test_entity_versioned(self):
+        """Testa a coluna @Version só com a opção versioned"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("entity.java.j2", context)
+        self.assertNotIn("@Version", result)
+
+        context["options"] = {"versioned": True}
+        result = self.render_template_to_string("entity.java.j2", context)
+        self.assertIn(
+            '@Version\n    @Column(name = "VERSAO", nullable = false)\n    private Long versao;',
+            result,
+        )
+
+    def test_entity_dynamic_update(self):
+        """Testa o @DynamicUpdate só com a opção patch"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("entity.java.j2", context)
+        self.assertNotIn("@DynamicUpdate", result)
+
+        context["options"] = {"patch": True}
+        result = self.render_template_to_string("entity.java.j2", context)
+        self.assertIn("import org.hibernate.annotations.DynamicUpdate;", result)
+        self.assertIn("@DynamicUpdate", result)
+
+    def test_entity_sequence_id_strategy(self):
+        """Testa a sequência com otimizador pooled (permite INSERT em lote)"""
+        context = self.get_basic_context()
+        context["options"] = {"id_strategy": "sequence", "id_allocation_size": 100}
+        result = self.render_template_to_string("entity.java.j2", context)
+
+        self.assertIn(
+            '@GeneratedValue(strategy = GenerationType.SEQUENCE, generator = "tb_cliente_seq")',
+            result,
+        )
+        self.assertIn(
+            '@SequenceGenerator(name = "tb_cliente_seq", sequenceName = "TB_CLIENTE_SEQ", allocationSize = 100)',
+            result,
+        )
+        self.assertNotIn("GenerationType.IDENTITY", result)
+
     def test_entity_basic_generation(self):
         """Testa geração básica de entidade"""
         context = self.get_basic_context()
@@ -81,13 +180,17 @@ class TestServiceTemplate(BaseTestCase):
         self.assertIn("private final ClienteMapper mapper;", result)
 
         # Verificar métodos principais
-        self.assertIn("public List<Cliente> findAll()", result)
-        self.assertIn("public List<ClienteResponse> findAllResponses()", result)
+        self.assertIn("public Page<Cliente> findAll(Pageable pageable)", result)
+        self.assertIn(
+            "public Page<ClienteResponse> findAllResponses(Pageable pageable)", result
+        )
         self.assertIn("public Cliente findById(Long id)", result)
         self.assertIn("public ClienteResponse findResponseById(Long id)", result)
         self.assertIn("public ClienteResponse saveFromRequest", result)
         self.assertIn("public ClienteResponse updateFromRequest", result)
         self.assertIn("public void delete(Long id)", result)
+        self.assertIn("repository.deleteDirectlyById(id) == 0", result)
+        self.assertIn("return repository.existsById(id);", result)
 
     def test_service_mapstruct_usage(self):
         """Testa se service usa MapStruct corretamente"""
@@ -95,7 +198,7 @@ class TestServiceTemplate(BaseTestCase):
         result = self.render_template_to_string("service.java.j2", context)
 
         # Verificar uso do mapper
-        self.assertIn("mapper.toResponseList", result)
+        self.assertIn("map(mapper::toResponse)", result)
         self.assertIn("mapper.toEntity", result)
         self.assertIn("mapper.toResponse", result)
         self.assertIn("mapper.updateEntityFromRequest", result)
@@ -113,6 +216,260 @@ class TestServiceTemplate(BaseTestCase):
         self.assertIn("Cliente com ID", result)
         self.assertNotIn("not found", result)
 
+    def test_service_pagination_limits_page_size(self):
+        """Testa que a listagem paginada impõe o tamanho máximo de página"""
+        context = self.get_basic_context()
+        context["options"] = {"pagination": "offset", "max_page_size": 50}
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn("public static final int MAX_PAGE_SIZE = 50;", result)
+        self.assertIn("repository.findAll(limitPageSize(pageable))", result)
+        self.assertNotIn("repository.findAll()", result)
+
+    def test_service_unbounded_option(self):
+        """Testa que a listagem sem paginação só existe como opção explícita"""
+        context = self.get_basic_context()
+        context["options"] = {"pagination": "unbounded"}
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn("public List<Cliente> findAll()", result)
+        self.assertIn("mapper.toResponseList(repository.findAll())", result)
+        self.assertNotIn("Pageable", result)
+
+    def test_service_keyset_pagination(self):
+        """Testa a paginação por cursor no ID"""
+        context = self.get_basic_context()
+        context["options"] = {"pagination": "keyset", "max_page_size": 50}
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn(
+            "public ClienteResponse.CursorPage findAllResponses(String cursor, int size)",
+            result,
+        )
+        self.assertIn("repository.findByIdGreaterThanOrderByIdAsc(afterId", result)
+        self.assertIn("findAfter(decodeCursor(cursor), limit + 1)", result)
+        # A malformed cursor is a client error (400), not a 500
+        self.assertIn(
+            'throw new ResponseStatusException(HttpStatus.BAD_REQUEST, "Cursor \'" + cursor',
+            result,
+        )
+        self.assertIn("import org.springframework.http.HttpStatus;", result)
+        self.assertIn(
+            "import org.springframework.web.server.ResponseStatusException;", result
+        )
+        self.assertNotIn('IllegalArgumentException("Cursor', result)
+        self.assertIn("public static final int MAX_PAGE_SIZE = 50;", result)
+        self.assertNotIn("Page<", result)
+
+    def test_service_projections(self):
+        """Testa que as leituras da resposta usam a projeção do repository"""
+        context = self.get_basic_context()
+        context["options"] = {"projections": True}
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn("repository.findViewById(id).map(mapper::viewToResponse)", result)
+        self.assertIn(
+            "repository.findAllViewsBy(limitPageSize(pageable)).map(mapper::viewToResponse)",
+            result,
+        )
+        # Escritas continuam carregando a entidade gerenciada
+        self.assertIn("Cliente existingEntity = findById(id);", result)
+
+        context["options"] = {"projections": True, "pagination": "keyset"}
+        result = self.render_template_to_string("service.java.j2", context)
+        self.assertIn("List<ClienteRepository.ClienteView> rows", result)
+        self.assertIn("repository.findViewsByIdGreaterThanOrderByIdAsc(", result)
+
+    def test_service_cache(self):
+        """Testa @Cacheable na leitura por ID e @CacheEvict nas escritas"""
+        context = self.get_basic_context()
+        context["options"] = {"cache": True, "bulk": True}
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn('public static final String CACHE = "Cliente";', result)
+        cached = result.index('@Cacheable(cacheNames = CACHE, key = "#id")')
+        self.assertLess(cached, result.index("public ClienteResponse findResponseById"))
+        self.assertEqual(
+            result.count('@CacheEvict(cacheNames = CACHE, key = "#id")'), 2
+        )
+        self.assertEqual(
+            result.count("@CacheEvict(cacheNames = CACHE, allEntries = true)"), 2
+        )
+
+    def test_service_export_stream(self):
+        """Testa a exportação pelo Stream do repository, limpando o contexto"""
+        context = self.get_basic_context()
+        context["options"] = {"export": True, "export_fetch_size": 500}
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn("public static final int EXPORT_FETCH_SIZE = 500;", result)
+        self.assertIn(
+            "public void exportResponses(Consumer<ClienteResponse> consumer)", result
+        )
+        self.assertIn(
+            "try (Stream<Cliente> rows = repository.streamAllByOrderByIdAsc())", result
+        )
+        self.assertIn("entityManager.clear();", result)
+
+        repository = self.render_template_to_string("repository.java.j2", context)
+        self.assertIn(
+            '@QueryHint(name = "org.hibernate.fetchSize", value = "500")', repository
+        )
+        self.assertIn("Stream<Cliente> streamAllByOrderByIdAsc();", repository)
+
+    def test_service_search_specification(self):
+        """Testa a busca por Specification (prefixo, igualdade e faixa)"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("service.java.j2", context)
+        self.assertNotIn("Specification", result)
+
+        context["fields"][0]["searchable"] = True
+        context["fields"].append(
+            {"name": "idade", "type": "Integer", "searchable": True}
+        )
+        context["options"] = {"pagination": "unbounded"}
+        result = self.render_template_to_string("service.java.j2", context)
+        self.assertNotIn("import java.time.LocalDate;", result)
+        self.assertNotIn("import java.math.BigDecimal;", result)
+        self.assertIn(
+            "public Page<ClienteResponse> searchResponses(ClienteRequest.Filter filter, Pageable pageable)",
+            result,
+        )
+        self.assertIn("cb.like(root.<String>get(\"nome\"), prefix, '\\\\')", result)
+        self.assertIn('cb.equal(root.get("idade"), filter.idade())', result)
+        self.assertIn(
+            'cb.greaterThanOrEqualTo(root.<Integer>get("idade"), filter.idadeMin())',
+            result,
+        )
+        self.assertIn("return Specification.allOf(specs);", result)
+        self.assertIn("static String escapeLike(String value)", result)
+        # Unbounded mode still caps the search page size
+        self.assertIn("public static final int MAX_PAGE_SIZE = 100;", result)
+        self.assertIn(
+            "private static Pageable limitPageSize(Pageable pageable)", result
+        )
+        self.assertNotIn('get("email")', result)
+
+        # The range type witnesses need their imports
+        context["fields"] += [
+            {"name": "nascimento", "type": "LocalDate", "searchable": True},
+            {"name": "limite", "type": "BigDecimal", "searchable": True},
+        ]
+        result = self.render_template_to_string("service.java.j2", context)
+        self.assertIn(
+            'cb.lessThanOrEqualTo(root.<LocalDate>get("nascimento"), filter.nascimentoMax())',
+            result,
+        )
+        self.assertIn(
+            'cb.greaterThanOrEqualTo(root.<BigDecimal>get("limite"), filter.limiteMin())',
+            result,
+        )
+        self.assertIn("import java.time.LocalDate;", result)
+        self.assertIn("import java.math.BigDecimal;", result)
+        self.assertNotIn("import java.time.LocalDateTime;", result)
+
+    def test_service_versioned_update(self):
+        """Testa a atualização condicionada à versão (If-Match)"""
+        context = self.get_basic_context()
+        context["options"] = {"versioned": True}
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn("return updateFromRequest(id, request, null);", result)
+        self.assertIn(
+            "public ClienteResponse updateFromRequest(Long id, ClienteRequest request, Long expectedVersion)",
+            result,
+        )
+        self.assertIn(
+            "throw new ObjectOptimisticLockingFailureException(Cliente.class, id);",
+            result,
+        )
+        self.assertIn("repository.findVersionById(id).orElseThrow(", result)
+        # The PUT response (and its ETag) needs the version incremented by the flush
+        self.assertIn(
+            "Cliente updatedEntity = repository.saveAndFlush(existingEntity);", result
+        )
+
+        context["options"] = {}
+        result = self.render_template_to_string("service.java.j2", context)
+        self.assertIn(
+            "Cliente updatedEntity = repository.save(existingEntity);", result
+        )
+        self.assertNotIn("saveAndFlush", result)
+
+    def test_service_patch(self):
+        """Testa o PATCH sem save() e com relacionamentos opcionais"""
+        context = self.get_relationship_context()
+        result = self.render_template_to_string("service.java.j2", context)
+        self.assertNotIn("patchFromRequest", result)
+        self.assertEqual(result.count("private void processRelationships("), 1)
+
+        context["options"] = {"patch": True}
+        result = self.render_template_to_string("service.java.j2", context)
+        self.assertIn(
+            "public PedidoResponse patchFromRequest(Long id, PedidoRequest.Patch patch) {",
+            result,
+        )
+        self.assertIn("mapper.patchEntityFromRequest(patch, existingEntity);", result)
+        self.assertIn("processRelationships(existingEntity, patch);", result)
+        self.assertIn(
+            "private void processRelationships(Pedido entity, PedidoRequest.Patch request) {",
+            result,
+        )
+        patch_method = result[result.index("patchFromRequest") :]
+        patch_method = patch_method[: patch_method.index("existsById")]
+        self.assertNotIn("repository.save(", patch_method)
+
+    def test_service_bulk_operations(self):
+        """Testa as operações em lote com saveAll/flush/clear por bloco"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("service.java.j2", context)
+        self.assertNotIn("EntityManager", result)
+
+        context["options"] = {"bulk": True, "bulk_chunk_size": 250}
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn("public static final int BULK_CHUNK_SIZE = 250;", result)
+        self.assertIn("private final EntityManager entityManager;", result)
+        self.assertIn(
+            "List<ClienteResponse.BulkItemResult> saveAllFromRequests(List<ClienteRequest> requests)",
+            result,
+        )
+        self.assertIn(
+            "updateAllFromRequests(List<ClienteRequest.BulkUpdate> updates)", result
+        )
+        self.assertIn("deleteAllByIds(List<Long> ids)", result)
+        self.assertIn("repository.saveAll(chunk);", result)
+        self.assertIn("entityManager.clear();", result)
+        self.assertNotIn("checkReferences", result)
+
+    def test_service_bulk_checks_references_per_chunk(self):
+        """Testa que FKs inexistentes viram erro do item, não falha do bloco"""
+        context = self.get_relationship_context()
+        context["options"] = {"bulk": True}
+        result = self.render_template_to_string("service.java.j2", context)
+
+        self.assertIn(
+            "private List<String> checkReferences(List<PedidoRequest> requests)",
+            result,
+        )
+        # One SELECT ... IN per target for the whole chunk
+        self.assertEqual(
+            result.count("clienteRepository.findAllById(requests.stream()"), 1
+        )
+        self.assertIn('"Cliente com ID \'" + id + "\' não foi encontrado"', result)
+        self.assertIn("List<String> referenceErrors = checkReferences(slice);", result)
+        self.assertIn(
+            "checkReferences(chunk.stream().map(PedidoRequest.BulkUpdate::data).toList())",
+            result,
+        )
+        self.assertEqual(
+            result.count("BulkItemResult(index, null, referenceErrors.get(offset))"),
+            1,
+        )
+        self.assertIn(
+            "BulkItemResult(index, update.id(), referenceErrors.get(offset))", result
+        )
+
 
 class TestControllerTemplate(BaseTestCase):
     """Testes para template controller.java.j2"""
@@ -156,6 +513,177 @@ class TestControllerTemplate(BaseTestCase):
         self.assertNotIn("@PathVariable UUID id", result)
         self.assertNotIn("import java.util.UUID", result)
 
+    def test_controller_paginated_list(self):
+        """Testa que a listagem recebe Pageable e devolve um PagedModel"""
+        context = self.get_basic_context()
+        context["options"] = {"page_size": 25}
+        result = self.render_template_to_string("controller.java.j2", context)
+
+        self.assertIn("ResponseEntity<PagedModel<ClienteResponse>> findAll(", result)
+        self.assertIn('@PageableDefault(size = 25, sort = "id"', result)
+        self.assertIn("new PagedModel<>(service.findAllResponses(pageable))", result)
+
+        context["options"] = {"pagination": "unbounded"}
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertIn("ResponseEntity<List<ClienteResponse>> findAll()", result)
+        self.assertNotIn("Pageable", result)
+
+    def test_controller_keyset_list(self):
+        """Testa a listagem por cursor"""
+        context = self.get_basic_context()
+        context["options"] = {"pagination": "keyset"}
+        result = self.render_template_to_string("controller.java.j2", context)
+
+        self.assertIn("ResponseEntity<ClienteResponse.CursorPage> findAll(", result)
+        self.assertIn("@RequestParam(required = false) String cursor", result)
+        self.assertIn('@RequestParam(defaultValue = "20") int size', result)
+
+    def test_controller_head_exists(self):
+        """Testa o HEAD /{id} que só verifica a existência"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("controller.java.j2", context)
+
+        self.assertIn(
+            '@RequestMapping(value = "/{id}", method = RequestMethod.HEAD)', result
+        )
+        self.assertIn("service.existsById(id)", result)
+
+    def test_controller_export_endpoint(self):
+        """Testa o endpoint de exportação em NDJSON/CSV"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertNotIn("StreamingResponseBody", result)
+
+        context["options"] = {"export": True}
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertIn('@GetMapping("/export")', result)
+        self.assertIn(
+            'public void export(@RequestParam(defaultValue = "ndjson") String format, '
+            "HttpServletResponse httpResponse) throws IOException",
+            result,
+        )
+        # Synchronous on purpose: no async request timeout cuts the export
+        self.assertNotIn("StreamingResponseBody", result)
+        self.assertIn('static final String CSV_HEADER = "id,nome,email";', result)
+        self.assertIn("MediaType.APPLICATION_NDJSON", result)
+        self.assertIn("csv(response.email())", result)
+
+    def test_controller_search_endpoint(self):
+        """Testa o GET /search paginado com os filtros como parâmetros"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertNotIn('"/search"', result)
+
+        context["fields"][1]["searchable"] = True
+        context["options"] = {"pagination": "keyset"}
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertIn('@GetMapping("/search")', result)
+        self.assertIn("@ParameterObject ClienteRequest.Filter filter", result)
+        self.assertIn("service.searchResponses(filter, pageable)", result)
+        self.assertIn("import org.springframework.data.web.PagedModel;", result)
+
+    def test_controller_etag_handling(self):
+        """Testa ETag, If-None-Match (304) e If-Match (412) com versioned"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertNotIn("eTag(", result)
+        self.assertIn("return ResponseEntity.ok(service.findResponseById(id));", result)
+
+        context["options"] = {"versioned": True}
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertIn(
+            "@RequestHeader(value = HttpHeaders.IF_NONE_MATCH, required = false) String ifNoneMatch",
+            result,
+        )
+        self.assertIn("Long version = service.findVersionById(id);", result)
+        self.assertIn(
+            "ResponseEntity.status(HttpStatus.NOT_MODIFIED).eTag(etag(version)).build()",
+            result,
+        )
+        self.assertIn(
+            "service.updateFromRequest(id, request, expectedVersion(ifMatch))", result
+        )
+        self.assertIn(
+            "@ExceptionHandler(OptimisticLockingFailureException.class)", result
+        )
+        self.assertIn("HttpStatus.PRECONDITION_FAILED : HttpStatus.CONFLICT", result)
+
+    def test_controller_patch_endpoint(self):
+        """Testa o PATCH /{id} com o record Patch"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertNotIn("@PatchMapping", result)
+
+        context["options"] = {"patch": True, "versioned": True}
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertIn('@PatchMapping("/{id}")', result)
+        self.assertIn("@RequestBody @Valid ClienteRequest.Patch patch", result)
+        self.assertIn(
+            "service.patchFromRequest(id, patch, expectedVersion(ifMatch))", result
+        )
+
+    def test_controller_completable_future(self):
+        """Testa os endpoints com CompletableFuture no executor limitado"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertNotIn("CompletableFuture", result)
+        self.assertNotIn("AsyncConfig", result)
+
+        context["options"] = {"async": "completable_future", "versioned": True}
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertIn("import com.erp.config.AsyncConfig;", result)
+        self.assertIn("private final Executor executor;", result)
+        self.assertIn(
+            "public ClienteController(ClienteService service, "
+            "@Qualifier(AsyncConfig.CRUD_EXECUTOR) Executor executor) {",
+            result,
+        )
+        self.assertNotIn("@Autowired", result)
+        self.assertNotIn("@RequiredArgsConstructor", result)
+        self.assertIn(
+            "public CompletableFuture<ResponseEntity<ClienteResponse>> create(", result
+        )
+        self.assertIn(
+            "return CompletableFuture.supplyAsync(() -> "
+            "ResponseEntity.status(201).body(service.saveFromRequest(request)), executor);",
+            result,
+        )
+        self.assertIn("}, executor);", result)
+        self.assertIn("@ExceptionHandler(TaskRejectedException.class)", result)
+        self.assertIn("HttpStatus.SERVICE_UNAVAILABLE", result)
+
+        test = self.render_template_to_string("controller_test.java.j2", context)
+        self.assertIn("import org.springframework.context.annotation.Import;", test)
+        self.assertIn("@Import(AsyncConfig.class)", test)
+        self.assertIn("mockMvc.perform(asyncDispatch(result))", test)
+        self.assertIn('perform(post("/api/cliente")', test)
+        self.assertNotIn('mockMvc.perform(post("/api/cliente")', test)
+
+    def test_controller_bulk_endpoints(self):
+        """Testa os endpoints em lote"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertNotIn('"/bulk"', result)
+
+        context["options"] = {"bulk": True}
+        result = self.render_template_to_string("controller.java.j2", context)
+        self.assertEqual(result.count('Mapping("/bulk")'), 3)
+        self.assertIn("@RequestBody List<@Valid ClienteRequest> requests", result)
+        self.assertIn(
+            "@RequestBody List<@Valid ClienteRequest.BulkUpdate> updates", result
+        )
+
+        request = self.render_template_to_string("request.java.j2", context)
+        self.assertIn(
+            "public record BulkUpdate(@NotNull Long id, @Valid @NotNull ClienteRequest data) {}",
+            request,
+        )
+        response = self.render_template_to_string("response.java.j2", context)
+        self.assertIn(
+            "public record BulkItemResult(int index, Long id, String error) {}",
+            response,
+        )
+
 
 class TestRepositoryTemplate(BaseTestCase):
     """Testes para template repository.java.j2"""
@@ -170,9 +698,91 @@ class TestRepositoryTemplate(BaseTestCase):
         self.assertIn("extends JpaRepository<Cliente, Long>", result)
         self.assertIn("@Repository", result)
 
+        # Consulta por cursor só quando a opção keyset está ativa
+        self.assertNotIn("findByIdGreaterThan", result)
+        context["options"] = {"pagination": "keyset"}
+        result = self.render_template_to_string("repository.java.j2", context)
+        self.assertIn(
+            "List<Cliente> findByIdGreaterThanOrderByIdAsc(Long id, Pageable pageable);",
+            result,
+        )
+
         # Verificar que não tem UUID
         self.assertNotIn("UUID", result)
 
+    def test_repository_direct_delete(self):
+        """Testa o DELETE direto só quando não há cascatas a aplicar"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("repository.java.j2", context)
+        self.assertIn(
+            "@Modifying(flushAutomatically = true, clearAutomatically = true)", result
+        )
+        self.assertIn('@Query("delete from Cliente e where e.id = :id")', result)
+        self.assertIn('int deleteDirectlyById(@Param("id") Long id);', result)
+        self.assertNotIn("deleteDirectlyByIdIn", result)
+
+        context["options"] = {"bulk": True}
+        result = self.render_template_to_string("repository.java.j2", context)
+        self.assertIn(
+            'int deleteDirectlyByIdIn(@Param("ids") Collection<Long> ids);', result
+        )
+        service = self.render_template_to_string("service.java.j2", context)
+        self.assertIn("repository.deleteDirectlyByIdIn(existing);", service)
+
+        # Coleções (orphanRemoval, tabela de junção) exigem a entidade carregada
+        context = self.get_relationship_context()
+        result = self.render_template_to_string("repository.java.j2", context)
+        self.assertNotIn("deleteDirectlyById", result)
+        service = self.render_template_to_string("service.java.j2", context)
+        self.assertIn("Pedido entity = findById(id);\n", service)
+        self.assertIn("repository.delete(entity);", service)
+
+    def test_repository_projections(self):
+        """Testa a interface de projeção com as colunas do Response"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("repository.java.j2", context)
+        self.assertNotIn("ClienteView", result)
+
+        context["options"] = {"projections": True, "pagination": "unbounded"}
+        result = self.render_template_to_string("repository.java.j2", context)
+
+        self.assertIn("interface ClienteView {", result)
+        self.assertIn("Long getId();", result)
+        self.assertIn("String getNome();", result)
+        self.assertIn("String getEmail();", result)
+        self.assertIn("Optional<ClienteView> findViewById(Long id);", result)
+        self.assertIn("List<ClienteView> findAllViewsBy();", result)
+
+    def test_repository_specification_executor(self):
+        """Testa o JpaSpecificationExecutor e o entity graph na busca"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("repository.java.j2", context)
+        self.assertNotIn("JpaSpecificationExecutor", result)
+
+        context = self.get_relationship_context()
+        context["fields"][0]["searchable"] = True
+        result = self.render_template_to_string("repository.java.j2", context)
+        self.assertIn(
+            "extends JpaRepository<Pedido, Long>, JpaSpecificationExecutor<Pedido> {",
+            result,
+        )
+        self.assertIn(
+            "Page<Pedido> findAll(Specification<Pedido> spec, Pageable pageable);",
+            result,
+        )
+
+    def test_repository_version_query(self):
+        """Testa a consulta só da versão usada pelo If-None-Match"""
+        context = self.get_basic_context()
+        context["options"] = {"versioned": True, "projections": True}
+        result = self.render_template_to_string("repository.java.j2", context)
+        self.assertIn(
+            '@Query("select e.versao from Cliente e where e.id = :id")\n'
+            '    Optional<Long> findVersionById(@Param("id") Long id);',
+            result,
+        )
+        self.assertIn("Long getVersao();", result)
+
 
 class TestMapperTemplate(BaseTestCase):
     """Testes para template mapper.java.j2"""
@@ -195,6 +805,34 @@ class TestMapperTemplate(BaseTestCase):
         # Verificar mappings
         self.assertIn('@Mapping(target = "id", ignore = true)', result)
 
+    def test_mapper_patch_ignores_nulls(self):
+        """Testa o mapeamento do PATCH que ignora valores null"""
+        context = self.get_relationship_context()
+        context["options"] = {"patch": True}
+        result = self.render_template_to_string("mapper.java.j2", context)
+        self.assertIn(
+            "@BeanMapping(nullValuePropertyMappingStrategy = NullValuePropertyMappingStrategy.IGNORE)",
+            result,
+        )
+        self.assertIn(
+            "void patchEntityFromRequest(PedidoRequest.Patch patch, @MappingTarget Pedido entity);",
+            result,
+        )
+
+    def test_mapper_projections(self):
+        """Testa a conversão da projeção para o Response"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("mapper.java.j2", context)
+        self.assertNotIn("viewToResponse", result)
+
+        context["options"] = {"projections": True}
+        result = self.render_template_to_string("mapper.java.j2", context)
+        self.assertIn("import com.erp.repository.ClienteRepository;", result)
+        self.assertIn(
+            "ClienteResponse viewToResponse(ClienteRepository.ClienteView view);",
+            result,
+        )
+
 
 class TestRequestTemplate(BaseTestCase):
     """Testes para template request.java.j2"""
@@ -226,6 +864,40 @@ class TestRequestTemplate(BaseTestCase):
         self.assertIn("@Digits", result)
         self.assertIn("BigDecimal preco", result)
 
+    def test_request_search_filter(self):
+        """Testa o record Filter com faixas e formato ISO para datas"""
+        context = self.get_basic_context()
+        result = self.render_template_to_string("request.java.j2", context)
+        self.assertNotIn("record Filter", result)
+
+        context["fields"][0]["searchable"] = True
+        context["fields"].append(
+            {"name": "nascimento", "type": "LocalDate", "searchable": True}
+        )
+        result = self.render_template_to_string("request.java.j2", context)
+        self.assertIn("public record Filter(", result)
+        self.assertIn("String nome,", result)
+        self.assertIn(
+            "@DateTimeFormat(iso = DateTimeFormat.ISO.DATE) LocalDate nascimentoMax",
+            result,
+        )
+        self.assertIn(
+            "import org.springframework.format.annotation.DateTimeFormat;", result
+        )
+
+    def test_request_patch_record(self):
+        """Testa o record Patch: campos opcionais com as validações de valor"""
+        context = self.get_bigdecimal_context()
+        context["options"] = {"patch": True}
+        result = self.render_template_to_string("request.java.j2", context)
+        self.assertIn("public record Patch(", result)
+        self.assertIn(
+            '@Pattern(regexp = "(?s).*\\\\S.*") @Size(max=100) String nome,', result
+        )
+        self.assertIn("@Positive @DecimalMin", result)
+        patch = result[result.index("public record Patch(") :]
+        self.assertNotIn("@NotBlank", patch)
+
 
 class TestResponseTemplate(BaseTestCase):
     """Testes para template response.java.j2"""
@@ -246,6 +918,25 @@ class TestResponseTemplate(BaseTestCase):
         # Verificar que factory methods foram removidos
         self.assertIn("MapStruct handled conversions", result)
         self.assertNotIn("public static ClienteResponse from", result)
+        self.assertNotIn("CursorPage", result)
+
+    def test_response_versioned(self):
+        """Testa a versão exposta no Response (base da ETag)"""
+        context = self.get_basic_context()
+        context["options"] = {"versioned": True}
+        result = self.render_template_to_string("response.java.j2", context)
+        self.assertIn("Long id,\n    Long versao,", result)
+
+    def test_response_cursor_page(self):
+        """Testa o envelope da paginação por cursor"""
+        context = self.get_basic_context()
+        context["options"] = {"pagination": "keyset"}
+        result = self.render_template_to_string("response.java.j2", context)
+
+        self.assertIn(
+            "public record CursorPage(List<ClienteResponse> content, String nextCursor) {}",
+            result,
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+import os
+import tempfile
+
+# Temp files are created 0600; generated sources get the usual umask permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_if_changed(path, content, encoding="utf-8"):
+    """
+    Grava content em path somente se o conteúdo em disco for diferente.
+
+    A escrita é atômica: o conteúdo vai para um arquivo temporário no
+    mesmo diretório, que então substitui o destino com os.replace. Uma
+    execução interrompida nunca deixa um arquivo pela metade, e arquivos
+    idênticos não são tocados (o mtime é preservado).
+
+    Devolve True se o arquivo foi escrito, False se já estava igual.
+    """
+    data = content.encode(encoding)
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def remove_output(path):
+    """
+    Remove um arquivo gerado e o diretório da entidade, se ficar vazio.
+    Devolve True se o arquivo existia.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+
+    directory = os.path.dirname(path)
+    if directory:
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass
+    return True